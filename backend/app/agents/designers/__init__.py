@@ -17,8 +17,9 @@ asyncio.gather for optimal performance.
 """
 
 import asyncio
+import functools
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from pydantic import ValidationError
 
 from app.models.workflow_models import (
@@ -80,6 +81,24 @@ __all__ = [
 # Parallel Workflow Design
 # ============================================================================
 
+@functools.cache
+def _get_designers() -> Tuple[
+    TriggerDesignerAgent, SwapDesignerAgent, StakeDesignerAgent, TransferDesignerAgent
+]:
+    """
+    Create the designer agents once per process.
+
+    Designers are stateless data formatters, so a single instance of each can
+    serve every request instead of being rebuilt per workflow.
+    """
+    return (
+        create_trigger_designer(),
+        create_swap_designer(),
+        create_stake_designer(),
+        create_transfer_designer(),
+    )
+
+
 async def design_workflow_nodes(
     workflow_spec: WorkflowSpec,
     llm: Optional = None
@@ -87,7 +106,7 @@ async def design_workflow_nodes(
     """
     Design all nodes for a workflow in parallel.
 
-    This function creates designer agents for each node type and runs them
+    This function dispatches each node to a shared designer agent and runs them
     in parallel using asyncio.gather for maximum performance.
 
     Args:
@@ -112,13 +131,10 @@ async def design_workflow_nodes(
     design_tasks: List[asyncio.Task] = []
 
     # ========================================================================
-    # Pre-instantiate designers ONCE for reuse (optimization)
+    # Reuse the process-wide designer instances
     # ========================================================================
 
-    trigger_designer = create_trigger_designer()
-    swap_designer = create_swap_designer()
-    stake_designer = create_stake_designer()
-    transfer_designer = create_transfer_designer()
+    trigger_designer, swap_designer, stake_designer, transfer_designer = _get_designers()
 
     # Calculate positions for vertical layout
     # Trigger at top, actions below
@@ -18,7 +18,7 @@ from app.models.workflow_models import (
     ParserSuccess,
     ParserError,
     ParserResponse,
-    EXAMPLE_WORKFLOWS,
+    get_example_workflows,
     TokenType,
     ActionType,
     TriggerType,
@@ -497,7 +497,7 @@ class WorkflowParserAgent(SpoonReactMCP):
         """Get example workflow specifications"""
         return {
             name: spec.model_dump()
-            for name, spec in EXAMPLE_WORKFLOWS.items()
+            for name, spec in get_example_workflows().items()
         }
 
 
@@ -8,7 +8,7 @@ This endpoint handles workflow deployment with payment verification:
 """
 
 import logging
-import uuid
+import secrets
 from datetime import datetime, UTC
 from typing import Optional
 
@@ -16,6 +16,7 @@ from fastapi import APIRouter, HTTPException, status, Depends
 from pydantic import BaseModel, Field
 
 from app.middleware import require_payment, create_402_response
+from app.models.api_models import utc_now
 from app.models.payment_models import PaymentVerificationResult, PaymentErrorCode
 from app.services.payment_service import get_payment_service
 from app.services.workflow_storage import get_workflow_storage
@@ -36,7 +37,7 @@ class DeploySuccessResponse(BaseModel):
     workflow_id: str = Field(..., description="Workflow identifier")
     status: str = Field(..., description="Workflow status after deployment")
     message: str = Field(..., description="Deployment success message")
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    timestamp: datetime = Field(default_factory=utc_now)
 
     model_config = {
         "json_schema_extra": {
@@ -55,7 +56,7 @@ class DeployErrorResponse(BaseModel):
     """Error deployment response"""
     success: bool = Field(False, description="Always false for errors")
     error: dict = Field(..., description="Error details")
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    timestamp: datetime = Field(default_factory=utc_now)
 
 
 # ============================================================================
@@ -316,7 +317,7 @@ async def deploy_workflow(
 
     except Exception as e:
         # Unexpected errors
-        error_id = str(uuid.uuid4())[:8]
+        error_id = secrets.token_hex(4)
         logger.error(f"Unexpected error deploying workflow {workflow_id} [error_id={error_id}]: {e}", exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
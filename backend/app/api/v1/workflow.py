@@ -2,51 +2,134 @@
 Workflow parsing endpoints for API v1
 """
 
-from fastapi import APIRouter, HTTPException, status, Request, Query
-from fastapi.responses import JSONResponse
-from typing import Optional, Dict, List, Any
-from pydantic import BaseModel, Field, field_validator
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+from typing import Optional, Dict, List, Any, Tuple, Union
+from pydantic import BaseModel, Field, TypeAdapter, field_validator, model_validator
+import orjson
+import functools
+import hashlib
+import hmac
 import logging
+import secrets
 import time
 import threading
 import asyncio
 import uuid
 from datetime import datetime, UTC
-from collections import defaultdict, deque
+from collections import OrderedDict
 
 from app.agents import (
     create_workflow_parser,
     WorkflowParserAgent,
     SPOON_AI_AVAILABLE,
     design_workflow_nodes,
+    NodeSpecification,
 )
 from app.services.graph_assembler import get_graph_assembler
-from app.services.workflow_storage import get_workflow_storage
+from app.services.workflow_storage import get_workflow_storage, fill_trigger_summary
 from app.services.execution_storage import get_execution_storage
+from app.config import settings
 from app.models.workflow_models import (
     WorkflowSpec,
-    ParserSuccess,
-    ParserError,
     ParserResponse,
+    construct_workflow_spec,
 )
-from app.models.graph_models import AssembledGraph
-from app.models.api_models import ErrorDetail, ErrorResponse
+from app.models.graph_models import AssembledGraph, GraphNode, GraphEdge
+from app.models.api_models import ErrorDetail, ErrorResponse, utc_now
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# Singleton parser instance for efficiency with thread-safe initialization
-_parser_instance: Optional[WorkflowParserAgent] = None
-_parser_lock = threading.Lock()
 
+class WorkflowError(HTTPException):
+    """
+    HTTPException carrying a structured workflow API error.
+
+    Raised instead of building the error dict inline; workflow_error_handler
+    renders it with the standard payload shape:
+    {"detail": {"success": False, "error": {...}, "timestamp": ...}}
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        code: str,
+        message: str,
+        details: Optional[str] = None,
+        retry: bool = True,
+        timestamp: Optional[Union[datetime, str]] = None
+    ):
+        """
+        Initialize WorkflowError.
+
+        Args:
+            status_code: HTTP status code
+            code: Machine-readable error code (e.g. "TIMEOUT_ERROR")
+            message: Human-readable error message
+            details: Optional additional details
+            retry: Whether the client may retry the request
+            timestamp: Request timestamp (datetime or ISO string); defaults to now
+        """
+        super().__init__(status_code=status_code)
+        self.code = code
+        self.message = message
+        self.details = details
+        self.retry = retry
+        self.timestamp = timestamp
+
+    def to_detail(self) -> Dict[str, Any]:
+        """Build the error payload placed under "detail" in the response."""
+        return {
+            "success": False,
+            "error": {
+                "code": self.code,
+                "message": self.message,
+                "details": self.details,
+                "retry": self.retry
+            },
+            "timestamp": self.timestamp or utc_now()
+        }
+
+
+async def workflow_error_handler(request: Request, exc: WorkflowError) -> ORJSONResponse:
+    """Render a WorkflowError as an orjson-encoded error response."""
+    return ORJSONResponse(
+        status_code=exc.status_code,
+        content={"detail": exc.to_detail()},
+        headers=exc.headers
+    )
+
+
+async def now_utc() -> datetime:
+    """Request timestamp dependency, shared by a handler's success and error responses."""
+    return utc_now()
 
 # Simple in-memory rate limiter (10 requests per minute per IP)
 # Note: For production, use Redis-backed rate limiting (e.g., slowapi)
-_rate_limit_store: Dict[str, deque] = defaultdict(deque)
+# Token bucket per IP: (tokens, last_refill). The store is LRU-bounded so
+# one-off clients cannot grow it without limit.
+_rate_limit_store: OrderedDict[str, Tuple[float, float]] = OrderedDict()
 _rate_limit_lock = threading.Lock()
 RATE_LIMIT_REQUESTS = 10
 RATE_LIMIT_WINDOW = 60  # seconds
+RATE_LIMIT_MAX_CLIENTS = 10_000
+_RATE_LIMIT_REFILL_PER_SECOND = RATE_LIMIT_REQUESTS / RATE_LIMIT_WINDOW
+RATE_LIMIT_DETAILS = f"Rate limit: {RATE_LIMIT_REQUESTS} requests per {RATE_LIMIT_WINDOW} seconds"
+
+# Routes guarded by rate_limit_middleware (registered in app.main)
+RATE_LIMITED_PATHS = frozenset({"/api/v1/parse", "/api/v1/generate"})
+MAX_REQUEST_BODY_BYTES = 64 * 1024
+
+# GenerateRequest input constraints (Issue #4 - Input Sanitization).
+# user_id: letters and digits in any script, underscore, hyphen and dot - the
+# same set the former str.isalnum() check accepted. \p{L}/\p{N} rely on
+# pydantic's default Rust regex engine.
+# user_address: "N/A" or a Neo N3 address - 'N' followed by Base58 characters
+# (no 0, O, I, l), 25-35 characters in total.
+USER_ID_PATTERN = r'^[\p{L}\p{N}_.\-]+$'
+USER_ADDRESS_PATTERN = r'^(N/A|N[1-9A-HJ-NP-Za-km-z]{24,34})$'
 
 
 def check_rate_limit(client_ip: str) -> bool:
@@ -54,59 +137,157 @@ def check_rate_limit(client_ip: str) -> bool:
     Check if client has exceeded rate limit.
     Returns True if request is allowed, False if rate limit exceeded.
 
-    Simple sliding window implementation: 10 requests per 60 seconds.
+    Token bucket: each IP holds up to 10 tokens, refilled continuously at
+    10 per 60 seconds. Each request is O(1) regardless of request history.
     """
-    current_time = time.time()
+    current_time = time.monotonic()
 
     with _rate_limit_lock:
-        # Get request timestamps for this IP
-        timestamps = _rate_limit_store[client_ip]
+        bucket = _rate_limit_store.get(client_ip)
+        if bucket is None:
+            tokens = float(RATE_LIMIT_REQUESTS)
+        else:
+            prev_tokens, last_refill = bucket
+            tokens = min(
+                RATE_LIMIT_REQUESTS,
+                prev_tokens + (current_time - last_refill) * _RATE_LIMIT_REFILL_PER_SECOND
+            )
+            _rate_limit_store.move_to_end(client_ip)
 
-        # Remove timestamps older than the window
-        while timestamps and current_time - timestamps[0] > RATE_LIMIT_WINDOW:
-            timestamps.popleft()
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
 
-        # Check if limit exceeded
-        if len(timestamps) >= RATE_LIMIT_REQUESTS:
-            return False
+        _rate_limit_store[client_ip] = (tokens, current_time)
 
-        # Add current request
-        timestamps.append(current_time)
-        return True
+        # Evict least recently seen clients beyond capacity
+        while len(_rate_limit_store) > RATE_LIMIT_MAX_CLIENTS:
+            _rate_limit_store.popitem(last=False)
 
+        return allowed
 
+
+async def rate_limit_middleware(request: Request, call_next):
+    """
+    Apply the per-IP rate limit and body-size cap to the parse/generate routes.
+
+    Runs as HTTP middleware so throttled or oversized requests are rejected
+    before FastAPI reads and validates the request body.
+    """
+    if request.method == "POST" and request.url.path in RATE_LIMITED_PATHS:
+        content_length = request.headers.get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > MAX_REQUEST_BODY_BYTES:
+            error = WorkflowError(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                code="PAYLOAD_TOO_LARGE",
+                message="Request body too large",
+                details=f"Maximum request size is {MAX_REQUEST_BODY_BYTES} bytes",
+                retry=False
+            )
+            return await workflow_error_handler(request, error)
+
+        client_ip = request.client.host if request.client else "unknown"
+        if not check_rate_limit(client_ip):
+            logger.warning(f"Rate limit exceeded for IP: {client_ip}")
+            error = WorkflowError(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                code="RATE_LIMIT_EXCEEDED",
+                message="Too many requests",
+                details=RATE_LIMIT_DETAILS
+            )
+            return await workflow_error_handler(request, error)
+
+    return await call_next(request)
+
+
+@functools.cache
 def get_parser() -> WorkflowParserAgent:
     """
     Get or create the workflow parser agent instance.
 
-    Uses a thread-safe singleton pattern to avoid recreating the agent on each request.
+    The agent is created on first use and cached for the life of the process,
+    so later calls are a plain cache hit with no locking. Failures are not
+    cached, so availability is re-checked until creation succeeds.
     Raises HTTPException if spoon_ai is not available.
     """
-    global _parser_instance
-
     # Check if spoon_ai is available
     if not SPOON_AI_AVAILABLE or create_workflow_parser is None:
         logger.error("Parser unavailable: spoon_ai package not installed")
-        raise HTTPException(
+        raise WorkflowError(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail={
-                "success": False,
-                "error": {
-                    "code": "PARSER_UNAVAILABLE",
-                    "message": "AI parser service is temporarily unavailable",
-                    "details": "The spoon_ai package is not properly configured. Please check server logs.",
-                    "retry": True
-                },
-                "timestamp": datetime.now(UTC).isoformat()
-            }
+            code="PARSER_UNAVAILABLE",
+            message="AI parser service is temporarily unavailable",
+            details="The spoon_ai package is not properly configured. Please check server logs."
         )
 
-    if _parser_instance is None:
-        with _parser_lock:
-            if _parser_instance is None:
-                logger.info("Creating WorkflowParserAgent instance")
-                _parser_instance = create_workflow_parser()
-    return _parser_instance
+    logger.info("Creating WorkflowParserAgent instance")
+    return create_workflow_parser()
+
+
+# workflow_spec_token is an HMAC-SHA256 of the spec /parse returned, so any
+# worker can check that /generate received that spec back unchanged and
+# rebuild it with construct_workflow_spec instead of re-validating the nested
+# trigger/steps tree. The key must be shared across workers (see
+# Settings.workflow_spec_token_secret); without it each process signs with its
+# own random key and tokens from other workers fall back to full validation.
+_SPEC_TOKEN_KEY = (
+    settings.workflow_spec_token_secret.encode()
+    if settings.workflow_spec_token_secret
+    else secrets.token_bytes(32)
+)
+
+
+def _normalize_spec_numbers(value: Any) -> Any:
+    """Map ints to floats so 5 and 5.0 sign alike (JS clients drop the ".0")."""
+    if isinstance(value, dict):
+        return {key: _normalize_spec_numbers(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_normalize_spec_numbers(item) for item in value]
+    if isinstance(value, int) and not isinstance(value, bool):
+        return float(value)
+    return value
+
+
+def _sign_spec_payload(payload: Dict[str, Any]) -> str:
+    """HMAC a JSON-mode spec payload over its canonical (sorted-key) encoding."""
+    canonical = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    return hmac.new(_SPEC_TOKEN_KEY, canonical, hashlib.sha256).hexdigest()
+
+
+def issue_workflow_spec_token(workflow_spec: WorkflowSpec) -> str:
+    """
+    Sign a validated WorkflowSpec and return the token identifying it.
+
+    Args:
+        workflow_spec: Spec produced and validated by the parser
+
+    Returns:
+        Opaque token to be echoed back on /generate
+    """
+    return _sign_spec_payload(_normalize_spec_numbers(workflow_spec.model_dump(mode="json")))
+
+
+def get_trusted_workflow_spec(token: Any, raw_spec: Any) -> Optional[WorkflowSpec]:
+    """
+    Rebuild the WorkflowSpec without validation if the token signs the payload.
+
+    Args:
+        token: workflow_spec_token from the request
+        raw_spec: workflow_spec as received in the request body
+
+    Returns:
+        The unvalidated WorkflowSpec, or None if there is no token or the spec
+        does not match the one the token was issued for
+    """
+    if not isinstance(token, str) or not isinstance(raw_spec, dict):
+        return None
+    try:
+        payload = _normalize_spec_numbers(raw_spec)
+        if not hmac.compare_digest(token.encode(), _sign_spec_payload(payload).encode()):
+            return None
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return construct_workflow_spec(payload)
 
 
 # ============================================================================
@@ -150,7 +331,11 @@ class ParseSuccessResponse(BaseModel):
     confidence: float = Field(..., ge=0, le=1, description="Parser confidence score")
     parse_time_ms: float = Field(..., description="Time taken to parse in milliseconds")
     sla_exceeded: bool = Field(False, description="True if parse time exceeded 5000ms SLA")
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    workflow_spec_token: Optional[str] = Field(
+        None,
+        description="Opaque token to send back with this workflow_spec on /generate"
+    )
+    timestamp: datetime = Field(default_factory=utc_now)
 
     model_config = {
         "json_schema_extra": {
@@ -190,7 +375,7 @@ class ParseErrorResponse(BaseModel):
     """Error parse response"""
     success: bool = Field(False, description="Always false for parse errors")
     error: ErrorDetail = Field(..., description="Detailed error information")
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    timestamp: datetime = Field(default_factory=utc_now)
 
     model_config = {
         "json_schema_extra": {
@@ -214,7 +399,7 @@ class ParseErrorResponse(BaseModel):
 
 @router.post(
     "/parse",
-    response_model=ParseSuccessResponse,
+    response_model=None,
     summary="Parse natural language workflow",
     description="Convert a natural language workflow description into a structured WorkflowSpec",
     responses={
@@ -241,7 +426,7 @@ class ParseErrorResponse(BaseModel):
     },
     tags=["workflow"]
 )
-async def parse_workflow(request: ParseRequest, http_request: Request) -> ParseSuccessResponse:
+async def parse_workflow(request: ParseRequest, http_request: Request) -> Response:
     """
     Parse a natural language workflow description into a structured WorkflowSpec.
 
@@ -263,32 +448,20 @@ async def parse_workflow(request: ParseRequest, http_request: Request) -> ParseS
         http_request: FastAPI Request object for client IP extraction
 
     Returns:
-        ParseSuccessResponse with the parsed workflow specification
+        Pre-serialized ParseSuccessResponse with the parsed workflow specification
 
     Raises:
         HTTPException: If parsing fails or validation errors occur
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
+    # One timestamp per request, shared by the success and error responses
+    request_time = datetime.now(UTC)
+    request_timestamp = request_time.isoformat()
 
-    # Rate limiting
+    # Rate limiting is enforced by rate_limit_middleware before body parsing
     client_ip = http_request.client.host if http_request.client else "unknown"
-    if not check_rate_limit(client_ip):
-        logger.warning(f"Rate limit exceeded for IP: {client_ip}")
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail={
-                "success": False,
-                "error": {
-                    "code": "RATE_LIMIT_EXCEEDED",
-                    "message": "Too many requests",
-                    "details": f"Rate limit: {RATE_LIMIT_REQUESTS} requests per {RATE_LIMIT_WINDOW} seconds",
-                    "retry": True
-                },
-                "timestamp": datetime.now(UTC).isoformat()
-            }
-        )
 
-    logger.info(f"Received parse request from {client_ip}: {request.input[:100]}...")
+    logger.info("Received parse request from %s: %s...", client_ip, request.input[:100])
 
     try:
         # Get parser instance
@@ -301,24 +474,18 @@ async def parse_workflow(request: ParseRequest, http_request: Request) -> ParseS
                 timeout=5.0
             )
         except asyncio.TimeoutError:
-            error_id = str(uuid.uuid4())[:8]
+            error_id = secrets.token_hex(4)
             logger.error(f"Parse timeout after 5s [error_id={error_id}]")
-            raise HTTPException(
+            raise WorkflowError(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail={
-                    "success": False,
-                    "error": {
-                        "code": "TIMEOUT_ERROR",
-                        "message": "Parser request timed out",
-                        "details": f"The parsing operation exceeded the 5 second timeout. Error ID: {error_id}",
-                        "retry": True
-                    },
-                    "timestamp": datetime.now(UTC).isoformat()
-                }
+                code="TIMEOUT_ERROR",
+                message="Parser request timed out",
+                details=f"The parsing operation exceeded the 5 second timeout. Error ID: {error_id}",
+                timestamp=request_timestamp
             )
 
         # Calculate parse time
-        parse_time_ms = (time.time() - start_time) * 1000
+        parse_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
         # Check if we exceeded the 5-second SLA
         sla_exceeded = parse_time_ms > 5000
@@ -326,48 +493,46 @@ async def parse_workflow(request: ParseRequest, http_request: Request) -> ParseS
             logger.warning(f"Parse time {parse_time_ms}ms exceeded 5s SLA")
 
         # Handle success
-        if isinstance(result, ParserSuccess):
-            logger.info(f"Successfully parsed workflow in {parse_time_ms:.2f}ms")
-            return ParseSuccessResponse(
+        if result.success is True:
+            logger.info("Successfully parsed workflow in %.2fms", parse_time_ms)
+            # The parser output is already validated, so build the response without
+            # re-validation and serialize it straight to JSON bytes. Returning a
+            # Response bypasses FastAPI's response_model round-trip; the model is
+            # still documented on the route for the OpenAPI schema.
+            response = ParseSuccessResponse.model_construct(
                 success=True,
                 workflow_spec=result.workflow,
                 confidence=result.confidence,
                 parse_time_ms=round(parse_time_ms, 2),
-                sla_exceeded=sla_exceeded
+                sla_exceeded=sla_exceeded,
+                workflow_spec_token=issue_workflow_spec_token(result.workflow),
+                timestamp=request_time
+            )
+            return Response(
+                content=response.model_dump_json(),
+                media_type="application/json"
             )
 
         # Handle parser errors (semantic/logical errors in the description)
-        elif isinstance(result, ParserError):
+        elif result.success is False:
             logger.warning(f"Parse error: {result.error}")
-            raise HTTPException(
+            raise WorkflowError(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail={
-                    "success": False,
-                    "error": {
-                        "code": "PARSE_ERROR",
-                        "message": result.error,
-                        "details": "; ".join(result.suggestions) if result.suggestions else None,
-                        "retry": True
-                    },
-                    "timestamp": datetime.now(UTC).isoformat()
-                }
+                code="PARSE_ERROR",
+                message=result.error,
+                details="; ".join(result.suggestions) if result.suggestions else None,
+                timestamp=request_timestamp
             )
 
         else:
             # Should never happen, but handle gracefully
             logger.error(f"Unexpected result type: {type(result)}")
-            raise HTTPException(
+            raise WorkflowError(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail={
-                    "success": False,
-                    "error": {
-                        "code": "INTERNAL_ERROR",
-                        "message": "Unexpected error during parsing",
-                        "details": "The parser returned an unexpected result type",
-                        "retry": True
-                    },
-                    "timestamp": datetime.now(UTC).isoformat()
-                }
+                code="INTERNAL_ERROR",
+                message="Unexpected error during parsing",
+                details="The parser returned an unexpected result type",
+                timestamp=request_timestamp
             )
 
     except HTTPException:
@@ -377,36 +542,25 @@ async def parse_workflow(request: ParseRequest, http_request: Request) -> ParseS
     except ValueError as e:
         # Input validation errors - these are safe to expose as they come from validation
         logger.error(f"Validation error: {e}")
-        raise HTTPException(
+        raise WorkflowError(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail={
-                "success": False,
-                "error": {
-                    "code": "VALIDATION_ERROR",
-                    "message": "Invalid input",
-                    "details": str(e),
-                    "retry": False
-                },
-                "timestamp": datetime.now(UTC).isoformat()
-            }
+            code="VALIDATION_ERROR",
+            message="Invalid input",
+            details=str(e),
+            retry=False,
+            timestamp=request_timestamp
         )
 
     except Exception as e:
         # Unexpected errors - generate error ID for tracking, don't expose internal details
-        error_id = str(uuid.uuid4())[:8]
+        error_id = secrets.token_hex(4)
         logger.error(f"Unexpected error during parsing [error_id={error_id}]: {e}", exc_info=True)
-        raise HTTPException(
+        raise WorkflowError(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "success": False,
-                "error": {
-                    "code": "INTERNAL_ERROR",
-                    "message": "An unexpected error occurred during parsing",
-                    "details": f"Please contact support with error ID: {error_id}",
-                    "retry": True
-                },
-                "timestamp": datetime.now(UTC).isoformat()
-            }
+            code="INTERNAL_ERROR",
+            message="An unexpected error occurred during parsing",
+            details=f"Please contact support with error ID: {error_id}",
+            timestamp=request_timestamp
         )
 
 
@@ -414,6 +568,61 @@ async def parse_workflow(request: ParseRequest, http_request: Request) -> ParseS
 # Workflow List Endpoint - Story 6.8
 # ============================================================================
 
+# Serialized GET /workflows and GET /workflows/{id} bodies keyed by route
+# arguments. Each entry remembers the storage signature it was built from, so
+# writes from any path (PATCH/DELETE, activation, the scheduler, other worker
+# processes) make it stale; a hit costs a stat() instead of a full load and
+# Pydantic round-trip. Bodies are stored without their closing timestamp,
+# which is appended per request by _with_timestamp. LRU-bounded.
+_workflow_response_cache: OrderedDict[Tuple[Any, ...], Tuple[Any, bytes]] = OrderedDict()
+WORKFLOW_RESPONSE_CACHE_SIZE = 256
+
+
+def _get_cached_response(key: Tuple[Any, ...], signature: Any) -> Optional[bytes]:
+    """Return the cached body for key if it was built from the same signature."""
+    entry = _workflow_response_cache.get(key)
+    if entry is None or entry[0] != signature:
+        return None
+    _workflow_response_cache.move_to_end(key)
+    return entry[1]
+
+
+def _store_cached_response(key: Tuple[Any, ...], signature: Any, body: bytes) -> None:
+    """Cache a serialized response body, evicting the least recently used."""
+    _workflow_response_cache[key] = (signature, body)
+    _workflow_response_cache.move_to_end(key)
+    while len(_workflow_response_cache) > WORKFLOW_RESPONSE_CACHE_SIZE:
+        _workflow_response_cache.popitem(last=False)
+
+
+def _body_prefix(response: BaseModel) -> bytes:
+    """Serialize a response whose last field is timestamp, leaving it open."""
+    return response.model_dump_json(exclude={"timestamp"}).encode()[:-1] + b',"timestamp":'
+
+
+def _with_timestamp(body_prefix: bytes, now: datetime) -> bytes:
+    """Close a cached body prefix with this request's timestamp."""
+    # OPT_UTC_Z matches the "Z" form pydantic emits for the datetime field
+    return body_prefix + orjson.dumps(now, option=orjson.OPT_UTC_Z) + b"}"
+
+
+def _json_timestamp(value: datetime) -> str:
+    """Format a datetime the way pydantic serializes it (UTC as "Z")."""
+    return orjson.dumps(value, option=orjson.OPT_UTC_Z)[1:-1].decode()
+
+
+def _invalidate_workflow_responses(workflow_id: str) -> None:
+    """Drop cached detail and list bodies after a workflow changes."""
+    for key in list(_workflow_response_cache):
+        if key[0] == "list" or key == ("detail", workflow_id):
+            del _workflow_response_cache[key]
+
+
+# Page size bounds for GET /workflows
+LIST_WORKFLOWS_DEFAULT_LIMIT = 50
+LIST_WORKFLOWS_MAX_LIMIT = 200
+
+
 class WorkflowSummary(BaseModel):
     """Summary view of a workflow for listing"""
     workflow_id: str = Field(..., description="Unique workflow identifier")
@@ -432,8 +641,11 @@ class WorkflowListResponse(BaseModel):
     """Response for workflow listing"""
     success: bool = Field(True, description="Always true for successful requests")
     workflows: List[WorkflowSummary] = Field(..., description="List of workflow summaries")
-    total: int = Field(..., description="Total number of workflows")
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    total: int = Field(..., description="Total number of workflows matching the filters, across all pages")
+    limit: int = Field(LIST_WORKFLOWS_DEFAULT_LIMIT, description="Maximum workflows per page")
+    offset: int = Field(0, description="Number of workflows skipped")
+    has_more: bool = Field(False, description="Whether another page is available")
+    timestamp: datetime = Field(default_factory=utc_now)
 
 
 @router.get(
@@ -446,98 +658,87 @@ class WorkflowListResponse(BaseModel):
 async def list_workflows(
     workflow_status: Optional[str] = None,
     user_id: Optional[str] = None,
-) -> WorkflowListResponse:
+    limit: int = Query(
+        LIST_WORKFLOWS_DEFAULT_LIMIT,
+        ge=1,
+        le=LIST_WORKFLOWS_MAX_LIMIT,
+        description="Number of workflows to return"
+    ),
+    offset: int = Query(0, ge=0, description="Number of workflows to skip"),
+    now: datetime = Depends(now_utc),
+) -> Response:
     """
-    List all workflows with optional filtering.
+    List workflows with optional filtering, one page at a time.
 
     Args:
         workflow_status: Optional status filter (active, paused, completed, failed)
         user_id: Optional user ID filter
+        limit: Maximum number of workflows to return (default: 50, max: 200)
+        offset: Number of matching workflows to skip
 
     Returns:
-        WorkflowListResponse with list of workflow summaries
+        WorkflowListResponse with one page of workflow summaries
     """
-    logger.info(f"Listing workflows (status={workflow_status}, user_id={user_id})")
+    logger.info(f"Listing workflows (status={workflow_status}, user_id={user_id}, limit={limit}, offset={offset})")
 
     try:
         storage = get_workflow_storage()
-        workflows = await storage.list_workflows(user_id=user_id, status=workflow_status)
+        cache_key = ("list", workflow_status, user_id, limit, offset)
+        signature = storage.get_storage_signature()
+        body_prefix = _get_cached_response(cache_key, signature)
+        if body_prefix is not None:
+            return Response(content=_with_timestamp(body_prefix, now), media_type="application/json")
+
+        # Fetch one extra row to tell whether another page exists
+        rows = await storage.list_workflow_summaries(
+            user_id=user_id, status=workflow_status, limit=limit + 1, offset=offset
+        )
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        if offset == 0 and not has_more:
+            # The whole result fits on this page
+            total = len(rows)
+        else:
+            total = await storage.count_workflows(user_id=user_id, status=workflow_status)
 
-        # Convert to summaries
+        # Rows come from our own validated storage, so skip re-validation
         summaries = []
-        for w in workflows:
-            # Build trigger summary - handle legacy workflows without workflow_spec
-            workflow_spec = w.assembled_graph.workflow_spec
-            trigger = workflow_spec.trigger if workflow_spec else None
-            trigger_type = "manual"
-            trigger_summary = "Manual execution"
-
-            if trigger:
-                trigger_type = trigger.type
-                if trigger.type == "price":
-                    trigger_summary = f"When {trigger.token.value} {trigger.operator} ${trigger.value}"
-                elif trigger.type == "time":
-                    trigger_summary = f"Schedule: {trigger.schedule}"
-                else:
-                    trigger_summary = f"{trigger.type} trigger"
-            elif w.assembled_graph.state_graph_config:
-                # Fallback: extract trigger info from state_graph_config for legacy workflows
-                state_config = w.assembled_graph.state_graph_config
-                trigger_data = state_config.get("trigger", {})
-                trigger_type = trigger_data.get("type", "manual")
-                trigger_params = trigger_data.get("params", {})
-
-                if trigger_type == "price":
-                    token = trigger_params.get("token", "?")
-                    # Handle both new format (operator/value) and legacy format (condition/threshold)
-                    operator = trigger_params.get("operator") or trigger_params.get("condition", "?")
-                    value = trigger_params.get("value") or trigger_params.get("threshold", "?")
-                    # Normalize condition names for display
-                    if operator == "less_than":
-                        operator = "below"
-                    elif operator == "greater_than":
-                        operator = "above"
-                    trigger_summary = f"When {token} {operator} ${value}"
-                elif trigger_type == "time":
-                    schedule = trigger_params.get("schedule", "unknown schedule")
-                    trigger_summary = f"Schedule: {schedule}"
-                else:
-                    trigger_summary = f"{trigger_type} trigger"
-
-            summaries.append(WorkflowSummary(
+        for w in rows:
+            summaries.append(WorkflowSummary.model_construct(
                 workflow_id=w.workflow_id,
-                workflow_name=w.assembled_graph.workflow_name,
-                workflow_description=w.assembled_graph.workflow_description,
+                workflow_name=w.workflow_name,
+                workflow_description=w.workflow_description,
                 status=w.status,
                 enabled=w.enabled,
-                trigger_type=trigger_type,
-                trigger_summary=trigger_summary,
+                trigger_type=w.trigger_type,
+                trigger_summary=w.trigger_summary,
                 execution_count=w.execution_count,
                 created_at=w.created_at,
                 last_executed_at=w.last_executed_at,
             ))
 
-        return WorkflowListResponse(
+        body_prefix = _body_prefix(WorkflowListResponse.model_construct(
             success=True,
             workflows=summaries,
-            total=len(summaries),
-        )
+            total=total,
+            limit=limit,
+            offset=offset,
+            has_more=has_more,
+        ))
+        _store_cached_response(cache_key, signature, body_prefix)
+        return Response(content=_with_timestamp(body_prefix, now), media_type="application/json")
 
     except Exception as e:
-        error_id = str(uuid.uuid4())[:8]
+        error_id = secrets.token_hex(4)
         logger.error(f"Failed to list workflows [error_id={error_id}]: {e}", exc_info=True)
-        raise HTTPException(
+        raise WorkflowError(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "success": False,
-                "error": {
-                    "code": "INTERNAL_ERROR",
-                    "message": "Failed to list workflows",
-                    "details": f"Error ID: {error_id}",
-                    "retry": True
-                },
-                "timestamp": datetime.now(UTC).isoformat()
-            }
+            code="INTERNAL_ERROR",
+            message="Failed to list workflows",
+            details=f"Error ID: {error_id}",
+            retry=True,
+            timestamp=now
         )
 
 
@@ -555,15 +756,15 @@ class WorkflowDetailResponse(BaseModel):
     enabled: bool
     trigger_type: str
     trigger_summary: str
-    nodes: List[Dict[str, Any]]
-    edges: List[Dict[str, Any]]
+    nodes: List[GraphNode]
+    edges: List[GraphEdge]
     execution_count: int
     trigger_count: int
     created_at: datetime
     updated_at: datetime
     last_executed_at: Optional[datetime]
     last_error: Optional[str]
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    timestamp: datetime = Field(default_factory=utc_now)
 
 
 @router.get(
@@ -573,7 +774,10 @@ class WorkflowDetailResponse(BaseModel):
     description="Get detailed information about a specific workflow",
     tags=["workflow"]
 )
-async def get_workflow(workflow_id: str) -> WorkflowDetailResponse:
+async def get_workflow(
+    workflow_id: str,
+    now: datetime = Depends(now_utc)
+) -> Response:
     """
     Get detailed workflow information.
 
@@ -587,112 +791,63 @@ async def get_workflow(workflow_id: str) -> WorkflowDetailResponse:
 
     try:
         storage = get_workflow_storage()
-        w = await storage.load_workflow(workflow_id)
+        cache_key = ("detail", workflow_id)
+        signature = storage.get_workflow_signature(workflow_id)
+        body_prefix = _get_cached_response(cache_key, signature)
+        if body_prefix is not None:
+            return Response(content=_with_timestamp(body_prefix, now), media_type="application/json")
 
-        # Build trigger summary - handle legacy workflows without workflow_spec
-        workflow_spec = w.assembled_graph.workflow_spec
-        trigger = workflow_spec.trigger if workflow_spec else None
-        trigger_type = "manual"
-        trigger_summary = "Manual execution"
-
-        if trigger:
-            trigger_type = trigger.type
-            if trigger.type == "price":
-                trigger_summary = f"When {trigger.token.value} {trigger.operator} ${trigger.value}"
-            elif trigger.type == "time":
-                trigger_summary = f"Schedule: {trigger.schedule}"
-            else:
-                trigger_summary = f"{trigger.type} trigger"
-        elif w.assembled_graph.state_graph_config:
-            # Fallback: extract trigger info from state_graph_config for legacy workflows
-            state_config = w.assembled_graph.state_graph_config
-            trigger_data = state_config.get("trigger", {})
-            trigger_type = trigger_data.get("type", "manual")
-            trigger_params = trigger_data.get("params", {})
-
-            if trigger_type == "price":
-                token = trigger_params.get("token", "?")
-                # Handle both new format (operator/value) and legacy format (condition/threshold)
-                operator = trigger_params.get("operator") or trigger_params.get("condition", "?")
-                value = trigger_params.get("value") or trigger_params.get("threshold", "?")
-                # Normalize condition names for display
-                if operator == "less_than":
-                    operator = "below"
-                elif operator == "greater_than":
-                    operator = "above"
-                trigger_summary = f"When {token} {operator} ${value}"
-            elif trigger_type == "time":
-                schedule = trigger_params.get("schedule", "unknown schedule")
-                trigger_summary = f"Schedule: {schedule}"
-            else:
-                trigger_summary = f"{trigger_type} trigger"
-
-        # Convert nodes and edges
-        nodes = [n.model_dump() for n in w.assembled_graph.react_flow.nodes]
-        edges = [e.model_dump() for e in w.assembled_graph.react_flow.edges]
+        w = await storage.load_workflow(workflow_id)
 
-        return WorkflowDetailResponse(
+        body_prefix = _body_prefix(WorkflowDetailResponse.model_construct(
             success=True,
             workflow_id=w.workflow_id,
             workflow_name=w.assembled_graph.workflow_name,
             workflow_description=w.assembled_graph.workflow_description,
             status=w.status,
             enabled=w.enabled,
-            trigger_type=trigger_type,
-            trigger_summary=trigger_summary,
-            nodes=nodes,
-            edges=edges,
+            trigger_type=w.trigger_type,
+            trigger_summary=w.trigger_summary,
+            nodes=w.assembled_graph.react_flow.nodes,
+            edges=w.assembled_graph.react_flow.edges,
             execution_count=w.execution_count,
             trigger_count=w.trigger_count,
             created_at=w.created_at,
             updated_at=w.updated_at,
             last_executed_at=w.last_executed_at,
             last_error=w.last_error,
-        )
+        ))
+        _store_cached_response(cache_key, signature, body_prefix)
+        return Response(content=_with_timestamp(body_prefix, now), media_type="application/json")
 
     except FileNotFoundError:
-        raise HTTPException(
+        raise WorkflowError(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "success": False,
-                "error": {
-                    "code": "NOT_FOUND",
-                    "message": f"Workflow {workflow_id} not found",
-                    "retry": False
-                },
-                "timestamp": datetime.now(UTC).isoformat()
-            }
+            code="NOT_FOUND",
+            message=f"Workflow {workflow_id} not found",
+            retry=False,
+            timestamp=now
         )
 
     except ValueError as e:
-        raise HTTPException(
+        raise WorkflowError(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "success": False,
-                "error": {
-                    "code": "INVALID_ID",
-                    "message": str(e),
-                    "retry": False
-                },
-                "timestamp": datetime.now(UTC).isoformat()
-            }
+            code="INVALID_ID",
+            message=str(e),
+            retry=False,
+            timestamp=now
         )
 
     except Exception as e:
-        error_id = str(uuid.uuid4())[:8]
+        error_id = secrets.token_hex(4)
         logger.error(f"Failed to get workflow [error_id={error_id}]: {e}", exc_info=True)
-        raise HTTPException(
+        raise WorkflowError(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "success": False,
-                "error": {
-                    "code": "INTERNAL_ERROR",
-                    "message": "Failed to get workflow",
-                    "details": f"Error ID: {error_id}",
-                    "retry": True
-                },
-                "timestamp": datetime.now(UTC).isoformat()
-            }
+            code="INTERNAL_ERROR",
+            message="Failed to get workflow",
+            details=f"Error ID: {error_id}",
+            retry=True,
+            timestamp=now
         )
 
 
@@ -700,6 +855,10 @@ async def get_workflow(workflow_id: str) -> WorkflowDetailResponse:
 # Workflow Pause/Resume Endpoint - Story 6.8
 # ============================================================================
 
+# Statuses a client may set through PATCH /workflows/{workflow_id}
+UPDATABLE_WORKFLOW_STATUSES = frozenset({"active", "paused"})
+
+
 class UpdateWorkflowRequest(BaseModel):
     """Request to update workflow status"""
     enabled: Optional[bool] = Field(None, description="Enable/disable workflow")
@@ -707,26 +866,28 @@ class UpdateWorkflowRequest(BaseModel):
 
 
 class UpdateWorkflowResponse(BaseModel):
-    """Response after updating workflow"""
+    """Response after updating workflow (documents the 200 schema; the handler returns an ORJSONResponse)"""
     success: bool = Field(True)
     workflow_id: str
     status: str
     enabled: bool
     message: str
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    timestamp: datetime = Field(default_factory=utc_now)
 
 
 @router.patch(
     "/workflows/{workflow_id}",
-    response_model=UpdateWorkflowResponse,
+    response_model=None,
+    responses={200: {"model": UpdateWorkflowResponse}},
     summary="Update workflow",
     description="Update workflow status (pause/resume)",
     tags=["workflow"]
 )
 async def update_workflow(
     workflow_id: str,
-    request: UpdateWorkflowRequest
-) -> UpdateWorkflowResponse:
+    request: UpdateWorkflowRequest,
+    now: datetime = Depends(now_utc)
+) -> ORJSONResponse:
     """
     Update workflow status (pause/resume).
 
@@ -735,19 +896,17 @@ async def update_workflow(
         request: Update request with new status
 
     Returns:
-        UpdateWorkflowResponse with updated status
+        ORJSONResponse shaped as UpdateWorkflowResponse with updated status
     """
     logger.info(f"Updating workflow: {workflow_id}")
 
     try:
-        storage = get_workflow_storage()
-
-        # Build updates dict
+        # Validate the request before touching storage
         updates = {}
         if request.enabled is not None:
             updates["enabled"] = request.enabled
         if request.status is not None:
-            if request.status not in ("active", "paused"):
+            if request.status not in UPDATABLE_WORKFLOW_STATUSES:
                 raise ValueError("Status must be 'active' or 'paused'")
             updates["status"] = request.status
 
@@ -755,60 +914,48 @@ async def update_workflow(
             raise ValueError("No updates provided")
 
         # Update workflow
+        storage = get_workflow_storage()
         updated = await storage.update_workflow(workflow_id, updates)
+        _invalidate_workflow_responses(workflow_id)
 
         action = "resumed" if updated.enabled else "paused"
-        return UpdateWorkflowResponse(
-            success=True,
-            workflow_id=workflow_id,
-            status=updated.status,
-            enabled=updated.enabled,
-            message=f"Workflow {action} successfully",
-        )
+        return ORJSONResponse({
+            "success": True,
+            "workflow_id": workflow_id,
+            "status": updated.status,
+            "enabled": updated.enabled,
+            "message": f"Workflow {action} successfully",
+            "timestamp": _json_timestamp(now),
+        })
 
     except FileNotFoundError:
-        raise HTTPException(
+        raise WorkflowError(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "success": False,
-                "error": {
-                    "code": "NOT_FOUND",
-                    "message": f"Workflow {workflow_id} not found",
-                    "retry": False
-                },
-                "timestamp": datetime.now(UTC).isoformat()
-            }
+            code="NOT_FOUND",
+            message=f"Workflow {workflow_id} not found",
+            retry=False,
+            timestamp=now
         )
 
     except ValueError as e:
-        raise HTTPException(
+        raise WorkflowError(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "success": False,
-                "error": {
-                    "code": "INVALID_REQUEST",
-                    "message": str(e),
-                    "retry": False
-                },
-                "timestamp": datetime.now(UTC).isoformat()
-            }
+            code="INVALID_REQUEST",
+            message=str(e),
+            retry=False,
+            timestamp=now
         )
 
     except Exception as e:
-        error_id = str(uuid.uuid4())[:8]
+        error_id = secrets.token_hex(4)
         logger.error(f"Failed to update workflow [error_id={error_id}]: {e}", exc_info=True)
-        raise HTTPException(
+        raise WorkflowError(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "success": False,
-                "error": {
-                    "code": "INTERNAL_ERROR",
-                    "message": "Failed to update workflow",
-                    "details": f"Error ID: {error_id}",
-                    "retry": True
-                },
-                "timestamp": datetime.now(UTC).isoformat()
-            }
+            code="INTERNAL_ERROR",
+            message="Failed to update workflow",
+            details=f"Error ID: {error_id}",
+            retry=True,
+            timestamp=now
         )
 
 
@@ -817,21 +964,25 @@ async def update_workflow(
 # ============================================================================
 
 class DeleteWorkflowResponse(BaseModel):
-    """Response after deleting workflow"""
+    """Response after deleting workflow (documents the 200 schema; the handler returns an ORJSONResponse)"""
     success: bool = Field(True)
     workflow_id: str
     message: str
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    timestamp: datetime = Field(default_factory=utc_now)
 
 
 @router.delete(
     "/workflows/{workflow_id}",
-    response_model=DeleteWorkflowResponse,
+    response_model=None,
+    responses={200: {"model": DeleteWorkflowResponse}},
     summary="Delete workflow",
     description="Delete a workflow from the system",
     tags=["workflow"]
 )
-async def delete_workflow(workflow_id: str) -> DeleteWorkflowResponse:
+async def delete_workflow(
+    workflow_id: str,
+    now: datetime = Depends(now_utc)
+) -> ORJSONResponse:
     """
     Delete a workflow.
 
@@ -839,73 +990,102 @@ async def delete_workflow(workflow_id: str) -> DeleteWorkflowResponse:
         workflow_id: Workflow identifier
 
     Returns:
-        DeleteWorkflowResponse confirming deletion
+        ORJSONResponse shaped as DeleteWorkflowResponse confirming deletion
     """
     logger.info(f"Deleting workflow: {workflow_id}")
 
     try:
         storage = get_workflow_storage()
         await storage.delete_workflow(workflow_id)
+        _invalidate_workflow_responses(workflow_id)
 
-        return DeleteWorkflowResponse(
-            success=True,
-            workflow_id=workflow_id,
-            message="Workflow deleted successfully",
-        )
+        return ORJSONResponse({
+            "success": True,
+            "workflow_id": workflow_id,
+            "message": "Workflow deleted successfully",
+            "timestamp": _json_timestamp(now),
+        })
 
     except FileNotFoundError:
-        raise HTTPException(
+        raise WorkflowError(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "success": False,
-                "error": {
-                    "code": "NOT_FOUND",
-                    "message": f"Workflow {workflow_id} not found",
-                    "retry": False
-                },
-                "timestamp": datetime.now(UTC).isoformat()
-            }
+            code="NOT_FOUND",
+            message=f"Workflow {workflow_id} not found",
+            retry=False,
+            timestamp=now
         )
 
     except ValueError as e:
-        raise HTTPException(
+        raise WorkflowError(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "success": False,
-                "error": {
-                    "code": "INVALID_ID",
-                    "message": str(e),
-                    "retry": False
-                },
-                "timestamp": datetime.now(UTC).isoformat()
-            }
+            code="INVALID_ID",
+            message=str(e),
+            retry=False,
+            timestamp=now
         )
 
     except Exception as e:
-        error_id = str(uuid.uuid4())[:8]
+        error_id = secrets.token_hex(4)
         logger.error(f"Failed to delete workflow [error_id={error_id}]: {e}", exc_info=True)
-        raise HTTPException(
+        raise WorkflowError(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "success": False,
-                "error": {
-                    "code": "INTERNAL_ERROR",
-                    "message": "Failed to delete workflow",
-                    "details": f"Error ID: {error_id}",
-                    "retry": True
-                },
-                "timestamp": datetime.now(UTC).isoformat()
-            }
+            code="INTERNAL_ERROR",
+            message="Failed to delete workflow",
+            details=f"Error ID: {error_id}",
+            retry=True,
+            timestamp=now
         )
 
 
+# Complex real-world workflow examples showcasing full Spica capabilities
+# Features: Multi-step workflows, price triggers, time triggers, all action types, percentage & fixed amounts
+EXAMPLE_WORKFLOWS: Tuple[Dict[str, str], ...] = (
+    {
+        "input": "Every Monday at 9am, swap 25% of my GAS to NEO and stake all of it",
+        "description": "Weekly DCA strategy: Convert GAS to NEO and compound via staking",
+        "category": "multi-step"
+    },
+    {
+        "input": "When NEO rises above $25, swap 50% of my NEO to GAS and transfer 100 GAS to NikhQp1aAD1YFCiwknhM5LQQebj4464bCJ",
+        "description": "Profit-taking automation: Sell NEO at target price and send profits to savings wallet",
+        "category": "multi-step"
+    },
+    {
+        "input": "Every day at midnight, swap 10% of my bNEO to GAS, then stake 75% of my remaining bNEO",
+        "description": "Daily portfolio rebalancing: Harvest bNEO rewards and re-stake for compounding",
+        "category": "multi-step"
+    },
+    {
+        "input": "If GAS drops below $3, swap 500 GAS to bNEO and stake 100% of my bNEO",
+        "description": "Buy-the-dip automation: Accumulate bNEO when GAS is cheap and stake immediately",
+        "category": "multi-step"
+    },
+    {
+        "input": "Every Friday at 6pm, transfer 50 GAS to NikhQp1aAD1YFCiwknhM5LQQebj4464bCJ and stake 100% of my NEO",
+        "description": "Weekly savings routine: Send GAS to cold wallet and stake remaining NEO",
+        "category": "multi-step"
+    },
+    {
+        "input": "When bNEO rises above $18, swap 30% of my bNEO to NEO, swap 20% to GAS, and transfer 25 NEO to NikhQp1aAD1YFCiwknhM5LQQebj4464bCJ",
+        "description": "Advanced profit distribution: Diversify gains across tokens and secure profits",
+        "category": "multi-step"
+    },
+)
+
+# Static part of the examples response, serialized once; only the
+# timestamp is appended per request
+_EXAMPLES_BODY_PREFIX = orjson.dumps(
+    {"success": True, "examples": EXAMPLE_WORKFLOWS}
+)[:-1] + b',"timestamp":'
+
+
 @router.get(
     "/parse/examples",
     summary="Get example workflows",
     description="Returns example natural language prompts for reference",
     tags=["workflow"]
 )
-async def get_example_workflows():
+async def get_example_workflows(now: datetime = Depends(now_utc)) -> Response:
     """
     Get example workflow prompts.
 
@@ -913,48 +1093,34 @@ async def get_example_workflows():
     understand how to describe workflows.
 
     Returns:
-        dict: Example workflow prompts with descriptions
+        Pre-serialized JSON with example workflow prompts and descriptions
     """
-    # Complex real-world workflow examples showcasing full Spica capabilities
-    # Features: Multi-step workflows, price triggers, time triggers, all action types, percentage & fixed amounts
-    examples = [
-        {
-            "input": "Every Monday at 9am, swap 25% of my GAS to NEO and stake all of it",
-            "description": "Weekly DCA strategy: Convert GAS to NEO and compound via staking",
-            "category": "multi-step"
-        },
-        {
-            "input": "When NEO rises above $25, swap 50% of my NEO to GAS and transfer 100 GAS to NikhQp1aAD1YFCiwknhM5LQQebj4464bCJ",
-            "description": "Profit-taking automation: Sell NEO at target price and send profits to savings wallet",
-            "category": "multi-step"
-        },
-        {
-            "input": "Every day at midnight, swap 10% of my bNEO to GAS, then stake 75% of my remaining bNEO",
-            "description": "Daily portfolio rebalancing: Harvest bNEO rewards and re-stake for compounding",
-            "category": "multi-step"
-        },
-        {
-            "input": "If GAS drops below $3, swap 500 GAS to bNEO and stake 100% of my bNEO",
-            "description": "Buy-the-dip automation: Accumulate bNEO when GAS is cheap and stake immediately",
-            "category": "multi-step"
-        },
-        {
-            "input": "Every Friday at 6pm, transfer 50 GAS to NikhQp1aAD1YFCiwknhM5LQQebj4464bCJ and stake 100% of my NEO",
-            "description": "Weekly savings routine: Send GAS to cold wallet and stake remaining NEO",
-            "category": "multi-step"
-        },
-        {
-            "input": "When bNEO rises above $18, swap 30% of my bNEO to NEO, swap 20% to GAS, and transfer 25 NEO to NikhQp1aAD1YFCiwknhM5LQQebj4464bCJ",
-            "description": "Advanced profit distribution: Diversify gains across tokens and secure profits",
-            "category": "multi-step"
-        }
-    ]
+    return Response(
+        content=_EXAMPLES_BODY_PREFIX + orjson.dumps(now.isoformat()) + b"}",
+        media_type="application/json"
+    )
 
-    return {
+
+@functools.lru_cache(maxsize=1)
+def _capabilities_body_prefix(parser: WorkflowParserAgent) -> bytes:
+    """
+    Serialize the static part of the capabilities response for a parser.
+
+    Supported tokens, actions, and triggers are fixed for a parser instance,
+    so they are encoded once; only the timestamp is appended per request.
+    """
+    return orjson.dumps({
         "success": True,
-        "examples": examples,
-        "timestamp": datetime.now(UTC).isoformat()
-    }
+        "capabilities": {
+            "tokens": parser.get_supported_tokens(),
+            "actions": parser.get_supported_actions(),
+            "triggers": parser.get_supported_triggers(),
+        },
+        "constraints": {
+            "max_input_length": 500,
+            "max_parse_time_ms": 5000,
+        },
+    })[:-1] + b',"timestamp":'
 
 
 @router.get(
@@ -963,7 +1129,7 @@ async def get_example_workflows():
     description="Returns supported tokens, actions, and triggers",
     tags=["workflow"]
 )
-async def get_parser_capabilities():
+async def get_parser_capabilities(now: datetime = Depends(now_utc)) -> Response:
     """
     Get parser capabilities.
 
@@ -973,23 +1139,14 @@ async def get_parser_capabilities():
     - Supported triggers (price, time)
 
     Returns:
-        dict: Parser capabilities
+        Pre-serialized JSON with parser capabilities
     """
     parser = get_parser()
 
-    return {
-        "success": True,
-        "capabilities": {
-            "tokens": parser.get_supported_tokens(),
-            "actions": parser.get_supported_actions(),
-            "triggers": parser.get_supported_triggers(),
-        },
-        "constraints": {
-            "max_input_length": 500,
-            "max_parse_time_ms": 5000,
-        },
-        "timestamp": datetime.now(UTC).isoformat()
-    }
+    return Response(
+        content=_capabilities_body_prefix(parser) + orjson.dumps(now.isoformat()) + b"}",
+        media_type="application/json"
+    )
 
 
 # ============================================================================
@@ -1005,100 +1162,74 @@ class GenerateRequest(BaseModel):
     user_id: Optional[str] = Field(
         default="anonymous",
         description="User ID for workflow ownership",
-        max_length=100
+        max_length=100,
+        pattern=USER_ID_PATTERN
     )
     user_address: Optional[str] = Field(
         default="N/A",
         description="User's Neo N3 address",
-        max_length=100
+        max_length=100,
+        pattern=USER_ADDRESS_PATTERN
+    )
+    workflow_spec_token: Optional[str] = Field(
+        default=None,
+        description="Token returned by /parse with this workflow_spec",
+        max_length=64
     )
 
-    @field_validator('user_id', mode='after')
+    @model_validator(mode='before')
     @classmethod
-    def validate_user_id(cls, v: Optional[str]) -> str:
+    def normalize_user_fields(cls, data: Any) -> Any:
         """
-        Validate and sanitize user_id (Issue #4 - Input Sanitization).
+        Strip user_id/user_address and fall back to defaults when blank
+        (Issue #4 - Input Sanitization).
+
+        Character set and format checks are enforced by the field patterns,
+        which run inside pydantic-core without a Python callback per field.
+        A workflow_spec echoed back unchanged from /parse with its token is
+        rebuilt without validation and passed in as an instance, which
+        pydantic accepts as is.
 
         Args:
-            v: User ID to validate
+            data: Raw request payload
 
         Returns:
-            Validated user ID
-
-        Raises:
-            ValueError: If user_id contains invalid characters
-        """
-        if v is None:
-            return "anonymous"
-
-        # Strip whitespace
-        v = v.strip()
-
-        # Check for empty string
-        if not v:
-            return "anonymous"
-
-        # Allow alphanumeric, underscore, hyphen, and dot
-        # Reject potential injection characters
-        if not all(c.isalnum() or c in ('_', '-', '.') for c in v):
-            raise ValueError(
-                "user_id can only contain alphanumeric characters, underscore, hyphen, and dot"
-            )
-
-        # Check length
-        if len(v) > 100:
-            raise ValueError("user_id exceeds maximum length of 100 characters")
-
-        return v
-
-    @field_validator('user_address', mode='after')
-    @classmethod
-    def validate_user_address(cls, v: Optional[str]) -> str:
+            Payload with normalized user fields
         """
-        Validate and sanitize user_address (Issue #4 - Input Sanitization).
+        if not isinstance(data, dict):
+            return data
 
-        Args:
-            v: User address to validate
+        normalized = None
 
-        Returns:
-            Validated user address
+        trusted_spec = get_trusted_workflow_spec(
+            data.get("workflow_spec_token"), data.get("workflow_spec")
+        )
+        if trusted_spec is not None:
+            normalized = dict(data)
+            normalized["workflow_spec"] = trusted_spec
+
+        for field, default in (("user_id", "anonymous"), ("user_address", "N/A")):
+            if field not in data:
+                continue
+            value = data[field]
+            if value is None:
+                clean = default
+            elif isinstance(value, str):
+                clean = value.strip() or default
+            else:
+                continue
+            if clean != value:
+                # Copy on first change so the caller's payload is left untouched
+                if normalized is None:
+                    normalized = dict(data)
+                normalized[field] = clean
 
-        Raises:
-            ValueError: If user_address contains invalid characters or format
-        """
-        if v is None:
-            return "N/A"
-
-        # Strip whitespace
-        v = v.strip()
-
-        # Check for empty string
-        if not v:
-            return "N/A"
-
-        # If not N/A, validate Neo N3 address format
-        if v != "N/A":
-            # Neo N3 addresses start with 'N' and are Base58 encoded
-            # Length is typically 34 characters
-            if not v.startswith('N'):
-                raise ValueError("Neo N3 addresses must start with 'N'")
-
-            # Check length (Neo addresses are typically 34 characters)
-            if len(v) < 25 or len(v) > 35:
-                raise ValueError(
-                    "Invalid Neo N3 address length (expected 25-35 characters)"
-                )
-
-            # Check for valid Base58 characters (no 0, O, I, l)
-            valid_base58_chars = set('123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz')
-            if not all(c in valid_base58_chars for c in v):
-                raise ValueError(
-                    "Invalid characters in Neo N3 address (must be Base58)"
-                )
-
-        return v
+        return data if normalized is None else normalized
 
     model_config = {
+        # Unknown fields are rejected and validated requests are read-only
+        "extra": "forbid",
+        "frozen": True,
         "json_schema_extra": {
             "example": {
                 "workflow_spec": {
@@ -1130,7 +1261,12 @@ class GenerateRequest(BaseModel):
 
 
 class GenerateSuccessResponse(BaseModel):
-    """Successful graph generation response"""
+    """
+    Successful graph generation response.
+
+    Documents the /generate 200 schema only; the endpoint never instantiates
+    it and returns pre-encoded JSON bytes instead.
+    """
     success: bool = Field(True, description="Always true for successful generation")
     workflow_id: str = Field(..., description="Unique identifier for the generated workflow")
     nodes: List[Dict[str, Any]] = Field(..., description="React Flow nodes for visualization")
@@ -1139,7 +1275,7 @@ class GenerateSuccessResponse(BaseModel):
     workflow_description: str = Field(..., description="Description of the workflow")
     generation_time_ms: float = Field(..., description="Time taken to generate graph in milliseconds")
     sla_exceeded: bool = Field(False, description="True if generation time exceeded 10000ms SLA")
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    timestamp: datetime = Field(default_factory=utc_now)
 
     model_config = {
         "json_schema_extra": {
@@ -1185,12 +1321,55 @@ class GenerateErrorResponse(BaseModel):
     """Error graph generation response"""
     success: bool = Field(False, description="Always false for generation errors")
     error: ErrorDetail = Field(..., description="Detailed error information")
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    timestamp: datetime = Field(default_factory=utc_now)
+
+
+# Batch serializers for the generated React Flow graph
+_GRAPH_NODES_ADAPTER = TypeAdapter(List[GraphNode])
+_GRAPH_EDGES_ADAPTER = TypeAdapter(List[GraphEdge])
+
+# Designed nodes keyed by a content hash of the WorkflowSpec. Node design is
+# deterministic over the spec, so regenerating an unchanged spec (edit/replay
+# loops, demo examples) reuses the previous result. LRU-bounded.
+_designed_nodes_cache: OrderedDict[str, List[NodeSpecification]] = OrderedDict()
+DESIGNED_NODES_CACHE_SIZE = 512
+
+
+async def design_workflow_nodes_cached(workflow_spec: WorkflowSpec) -> List[NodeSpecification]:
+    """
+    Design workflow nodes, reusing the result for a previously seen spec.
+
+    Args:
+        workflow_spec: Workflow specification to design nodes for
+
+    Returns:
+        List of node specifications (a fresh list; cached entries are shared)
+    """
+    spec_key = hashlib.blake2b(
+        workflow_spec.model_dump_json().encode(),
+        digest_size=16
+    ).hexdigest()
+
+    cached = _designed_nodes_cache.get(spec_key)
+    if cached is not None:
+        _designed_nodes_cache.move_to_end(spec_key)
+        logger.info("Reusing designed nodes for workflow: %s", workflow_spec.name)
+        return list(cached)
+
+    # No lock needed: the cache is only touched between awaits, and two
+    # concurrent misses for the same spec simply store the same result
+    nodes = await design_workflow_nodes(workflow_spec)
+
+    _designed_nodes_cache[spec_key] = nodes
+    while len(_designed_nodes_cache) > DESIGNED_NODES_CACHE_SIZE:
+        _designed_nodes_cache.popitem(last=False)
+
+    return list(nodes)
 
 
 @router.post(
     "/generate",
-    response_model=GenerateSuccessResponse,
+    response_model=None,
     summary="Generate workflow graph",
     description="Convert a WorkflowSpec into a visual graph with nodes and edges",
     responses={
@@ -1224,7 +1403,7 @@ class GenerateErrorResponse(BaseModel):
 async def generate_workflow_graph(
     request: GenerateRequest,
     http_request: Request
-) -> GenerateSuccessResponse:
+) -> Response:
     """
     Generate a visual workflow graph from a WorkflowSpec.
 
@@ -1242,62 +1421,48 @@ async def generate_workflow_graph(
         http_request: FastAPI Request object for client IP extraction
 
     Returns:
-        GenerateSuccessResponse with nodes, edges, and workflow_id
+        JSON Response shaped as GenerateSuccessResponse with nodes, edges,
+        and workflow_id
 
     Raises:
         HTTPException: If generation fails or validation errors occur
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
+    # One timestamp per request, shared by the success and error responses
+    request_time = datetime.now(UTC)
+    request_timestamp = request_time.isoformat()
 
-    # Rate limiting (Issue #3)
+    # Rate limiting is enforced by rate_limit_middleware before body parsing
     client_ip = http_request.client.host if http_request.client else "unknown"
-    if not check_rate_limit(client_ip):
-        logger.warning(f"Rate limit exceeded for IP: {client_ip}")
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail={
-                "success": False,
-                "error": {
-                    "code": "RATE_LIMIT_EXCEEDED",
-                    "message": "Too many requests",
-                    "details": f"Rate limit: {RATE_LIMIT_REQUESTS} requests per {RATE_LIMIT_WINDOW} seconds",
-                    "retry": True
-                },
-                "timestamp": datetime.now(UTC).isoformat()
-            }
-        )
 
-    logger.info(f"Received generate request from {client_ip} for workflow: {request.workflow_spec.name}")
+    logger.info(
+        "Received generate request from %s for workflow: %s",
+        client_ip, request.workflow_spec.name
+    )
 
     try:
         # ====================================================================
         # Step 1: Design workflow nodes in parallel
         # ====================================================================
 
-        logger.info(f"Designing nodes for workflow: {request.workflow_spec.name}")
+        logger.info("Designing nodes for workflow: %s", request.workflow_spec.name)
 
         try:
             nodes = await asyncio.wait_for(
-                design_workflow_nodes(request.workflow_spec),
+                design_workflow_nodes_cached(request.workflow_spec),
                 timeout=8.0  # Leave 2 seconds for assembly and storage
             )
-            logger.info(f"Designed {len(nodes)} nodes in parallel")
+            logger.info("Designed %d nodes in parallel", len(nodes))
 
         except asyncio.TimeoutError:
-            error_id = str(uuid.uuid4())[:8]
+            error_id = secrets.token_hex(4)
             logger.error(f"Node design timeout after 8s [error_id={error_id}]")
-            raise HTTPException(
+            raise WorkflowError(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail={
-                    "success": False,
-                    "error": {
-                        "code": "TIMEOUT_ERROR",
-                        "message": "Node design timed out",
-                        "details": f"The node design operation exceeded the timeout. Error ID: {error_id}",
-                        "retry": True
-                    },
-                    "timestamp": datetime.now(UTC).isoformat()
-                }
+                code="TIMEOUT_ERROR",
+                message="Node design timed out",
+                details=f"The node design operation exceeded the timeout. Error ID: {error_id}",
+                timestamp=request_timestamp
             )
 
         # ====================================================================
@@ -1312,50 +1477,74 @@ async def generate_workflow_graph(
             nodes=nodes
         )
 
-        logger.info(f"Assembled graph with ID: {assembled.workflow_id}")
+        logger.info("Assembled graph with ID: %s", assembled.workflow_id)
 
         # ====================================================================
-        # Step 3: Store workflow
+        # Step 3: Store workflow, overlapped with response serialization
         # ====================================================================
 
-        logger.info(f"Storing workflow: {assembled.workflow_id}")
+        logger.info("Storing workflow: %s", assembled.workflow_id)
 
         storage = get_workflow_storage()
-        workflow_id = await storage.save_workflow(
+        save_task = asyncio.create_task(storage.save_workflow(
             assembled_graph=assembled,
             workflow_spec=request.workflow_spec,
             user_id=request.user_id,
             user_address=request.user_address
-        )
-
-        logger.info(f"Workflow stored successfully: {workflow_id}")
+        ))
 
         # ====================================================================
         # Step 4: Prepare response
         # ====================================================================
 
+        # Yield once so the save task runs up to its threaded file write, then
+        # serialize nodes and edges while the write is in flight. The response
+        # is only sent once the write succeeded.
+        await asyncio.sleep(0)
+        try:
+            nodes_json = _GRAPH_NODES_ADAPTER.dump_json(assembled.react_flow.nodes)
+            edges_json = _GRAPH_EDGES_ADAPTER.dump_json(assembled.react_flow.edges)
+        except BaseException:
+            # Let the write settle, but report the serialization error rather
+            # than anything the save raised
+            try:
+                await save_task
+            except Exception as save_error:
+                logger.error("Workflow save failed during serialization error: %s", save_error)
+            raise
+
+        workflow_id = await save_task
+
+        logger.info("Workflow stored successfully: %s", workflow_id)
+
         # Calculate generation time
-        generation_time_ms = (time.time() - start_time) * 1000
+        generation_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
         sla_exceeded = generation_time_ms > 10000
 
         if sla_exceeded:
             logger.warning(f"Generation time {generation_time_ms}ms exceeded 10s SLA")
 
-        # Convert nodes to dicts for response
-        nodes_dict = [node.model_dump() for node in assembled.react_flow.nodes]
-        edges_dict = [edge.model_dump() for edge in assembled.react_flow.edges]
-
-        logger.info(f"Successfully generated workflow graph in {generation_time_ms:.2f}ms")
-
-        return GenerateSuccessResponse(
-            success=True,
-            workflow_id=workflow_id,
-            nodes=nodes_dict,
-            edges=edges_dict,
-            workflow_name=assembled.workflow_name,
-            workflow_description=assembled.workflow_description,
-            generation_time_ms=round(generation_time_ms, 2),
-            sla_exceeded=sla_exceeded
+        logger.info("Successfully generated workflow graph in %.2fms", generation_time_ms)
+
+        # Every field is produced server-side, so the body is written as JSON
+        # bytes directly: the pre-serialized nodes and edges are spliced
+        # between orjson-encoded scalars.
+        # response_model is disabled on the route; GenerateSuccessResponse
+        # documents the 200 schema only.
+        return Response(
+            content=b"".join((
+                b'{"success":true,"workflow_id":', orjson.dumps(workflow_id),
+                b',"nodes":', nodes_json,
+                b',"edges":', edges_json,
+                b',"workflow_name":', orjson.dumps(assembled.workflow_name),
+                b',"workflow_description":', orjson.dumps(assembled.workflow_description),
+                b',"generation_time_ms":', orjson.dumps(round(generation_time_ms, 2)),
+                b',"sla_exceeded":', orjson.dumps(sla_exceeded),
+                # Same "Z"-suffixed form pydantic emits for the datetime field
+                b',"timestamp":', orjson.dumps(request_time, option=orjson.OPT_UTC_Z),
+                b"}",
+            )),
+            media_type="application/json"
         )
 
     except HTTPException:
@@ -1365,36 +1554,25 @@ async def generate_workflow_graph(
     except ValueError as e:
         # Validation errors
         logger.error(f"Validation error during generation: {e}")
-        raise HTTPException(
+        raise WorkflowError(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail={
-                "success": False,
-                "error": {
-                    "code": "VALIDATION_ERROR",
-                    "message": "Invalid workflow specification",
-                    "details": str(e),
-                    "retry": False
-                },
-                "timestamp": datetime.now(UTC).isoformat()
-            }
+            code="VALIDATION_ERROR",
+            message="Invalid workflow specification",
+            details=str(e),
+            retry=False,
+            timestamp=request_timestamp
         )
 
     except Exception as e:
         # Unexpected errors
-        error_id = str(uuid.uuid4())[:8]
+        error_id = secrets.token_hex(4)
         logger.error(f"Unexpected error during generation [error_id={error_id}]: {e}", exc_info=True)
-        raise HTTPException(
+        raise WorkflowError(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "success": False,
-                "error": {
-                    "code": "INTERNAL_ERROR",
-                    "message": "An unexpected error occurred during graph generation",
-                    "details": f"Please contact support with error ID: {error_id}",
-                    "retry": True
-                },
-                "timestamp": datetime.now(UTC).isoformat()
-            }
+            code="INTERNAL_ERROR",
+            message="An unexpected error occurred during graph generation",
+            details=f"Please contact support with error ID: {error_id}",
+            timestamp=request_timestamp
         )
 
 
@@ -1410,7 +1588,8 @@ async def generate_workflow_graph(
 )
 async def get_workflow_executions(
     workflow_id: str,
-    limit: int = Query(10, ge=1, le=50, description="Number of executions to return")
+    limit: int = Query(10, ge=1, le=50, description="Number of executions to return"),
+    now: datetime = Depends(now_utc)
 ):
     """
     Get recent executions for a specific workflow.
@@ -1431,35 +1610,35 @@ async def get_workflow_executions(
         storage = await get_execution_storage()
         executions = await storage.get_workflow_executions(workflow_id, limit=limit)
 
-        return [
+        # Returned as an ORJSONResponse so the datetimes are formatted by
+        # orjson natively (same ISO 8601 output as isoformat()) rather than
+        # one isoformat() call each plus a jsonable_encoder pass. This route
+        # has always sent isoformat()'s "+00:00" form rather than pydantic's
+        # "Z", so OPT_UTC_Z is deliberately not used here.
+        return ORJSONResponse([
             {
                 "execution_id": e.execution_id,
                 "workflow_id": e.workflow_id,
                 "workflow_name": e.workflow_name,
                 "status": e.status,
                 "trigger_type": e.trigger_type,
-                "started_at": e.started_at.isoformat(),
-                "completed_at": e.completed_at.isoformat() if e.completed_at else None,
+                "started_at": e.started_at,
+                "completed_at": e.completed_at,
                 "error": e.error
             }
             for e in executions
-        ]
+        ])
 
     except Exception as e:
-        error_id = str(uuid.uuid4())[:8]
+        error_id = secrets.token_hex(4)
         logger.error(f"Failed to get workflow executions [error_id={error_id}]: {e}", exc_info=True)
-        raise HTTPException(
+        raise WorkflowError(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "success": False,
-                "error": {
-                    "code": "INTERNAL_ERROR",
-                    "message": "Failed to get workflow executions",
-                    "details": f"Error ID: {error_id}",
-                    "retry": True
-                },
-                "timestamp": datetime.now(UTC).isoformat()
-            }
+            code="INTERNAL_ERROR",
+            message="Failed to get workflow executions",
+            details=f"Error ID: {error_id}",
+            retry=True,
+            timestamp=now
         )
 
 
@@ -1467,6 +1646,10 @@ async def get_workflow_executions(
 # Activate Workflow from Canvas - Hackathon Demo
 # ============================================================================
 
+# Canvas node data keys that are rendering metadata, not workflow parameters
+CANVAS_METADATA_KEYS = frozenset({"label", "icon", "status"})
+
+
 class ActivateCanvasNode(BaseModel):
     """Canvas node data"""
     id: str
@@ -1499,7 +1682,7 @@ class ActivateWorkflowResponse(BaseModel):
     workflow_id: str
     workflow_name: str
     message: str
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    timestamp: datetime = Field(default_factory=utc_now)
 
 
 @router.post(
@@ -1510,7 +1693,8 @@ class ActivateWorkflowResponse(BaseModel):
     tags=["workflow"]
 )
 async def activate_workflow_from_canvas(
-    request: ActivateWorkflowRequest
+    request: ActivateWorkflowRequest,
+    now: datetime = Depends(now_utc)
 ) -> ActivateWorkflowResponse:
     """
     Create an active workflow from canvas data.
@@ -1540,32 +1724,33 @@ async def activate_workflow_from_canvas(
         # Generate workflow ID
         workflow_id = f"wf_{uuid.uuid4().hex[:12]}"
 
-        # Convert canvas nodes to GraphNodes
-        graph_nodes = []
-        trigger_node = None
-        action_nodes = []
-        for node in request.nodes:
-            pos = NodePosition(
-                x=int(node.position.get("x", 0)),
-                y=int(node.position.get("y", 0))
-            )
-            graph_node = GraphNode(
+        # Convert canvas nodes to GraphNodes. The request body was already
+        # validated as ActivateCanvasNode/Edge, so the graph models are
+        # constructed without running their validators a second time.
+        graph_nodes = [
+            GraphNode.model_construct(
                 id=node.id,
                 type=node.type,
                 label=node.data.get("label", node.type.capitalize()),
                 parameters=node.data,
-                position=pos,
+                position=NodePosition.model_construct(
+                    x=int(node.position.get("x", 0)),
+                    y=int(node.position.get("y", 0))
+                ),
                 data=node.data
             )
-            graph_nodes.append(graph_node)
-            if node.type == "trigger":
-                trigger_node = node
-            else:
-                action_nodes.append(node)
+            for node in request.nodes
+        ]
+
+        # Partition into the trigger (last one wins) and ordered action nodes
+        trigger_node = next(
+            (node for node in reversed(request.nodes) if node.type == "trigger"), None
+        )
+        action_nodes = [node for node in request.nodes if node.type != "trigger"]
 
         # Convert canvas edges to GraphEdges
         graph_edges = [
-            GraphEdge(
+            GraphEdge.model_construct(
                 id=edge.id,
                 source=edge.source,
                 target=edge.target,
@@ -1576,27 +1761,27 @@ async def activate_workflow_from_canvas(
         ]
 
         # Create ReactFlowGraph
-        react_flow = ReactFlowGraph(nodes=graph_nodes, edges=graph_edges)
+        react_flow = ReactFlowGraph.model_construct(nodes=graph_nodes, edges=graph_edges)
 
         # Determine trigger type from nodes
         trigger_type = "time"
         trigger_params = {"schedule": "daily at 9am"}
         if trigger_node:
             trigger_type = trigger_node.data.get("type", "time")
-            trigger_params = {k: v for k, v in trigger_node.data.items() if k not in ["label", "icon", "status"]}
+            trigger_params = {k: v for k, v in trigger_node.data.items() if k not in CANVAS_METADATA_KEYS}
             # Ensure schedule exists for time triggers
             if trigger_type == "time" and "schedule" not in trigger_params:
                 trigger_params["schedule"] = "daily at 9am"
 
         # Build steps from action nodes
-        steps = []
-        for action_node in action_nodes:
-            step = {
+        steps = [
+            {
                 "action_type": action_node.type,
-                "params": {k: v for k, v in action_node.data.items() if k not in ["label", "icon", "status"]},
+                "params": {k: v for k, v in action_node.data.items() if k not in CANVAS_METADATA_KEYS},
                 "description": action_node.data.get("label", f"{action_node.type} action")
             }
-            steps.append(step)
+            for action_node in action_nodes
+        ]
 
         # Create state graph config (this is what list_workflows uses for trigger info)
         state_graph_config = {
@@ -1618,7 +1803,7 @@ async def activate_workflow_from_canvas(
                 "error": None,
                 "metadata": {
                     "workflow_name": request.workflow_name,
-                    "created_at": datetime.now(UTC).isoformat()
+                    "created_at": now.isoformat()
                 }
             }
         }
@@ -1644,13 +1829,12 @@ async def activate_workflow_from_canvas(
             trigger_count=0,
             execution_count=0
         )
+        fill_trigger_summary(stored)
 
-        # Save to storage
+        # Save to storage (locked atomic write, off the event loop)
         storage = get_workflow_storage()
-        file_path = storage.storage_dir / f"{workflow_id}.json"
-
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(stored.model_dump_json(indent=2))
+        await storage.save_stored_workflow(stored)
+        _invalidate_workflow_responses(workflow_id)
 
         logger.info(f"Successfully activated workflow: {workflow_id}")
 
@@ -1658,22 +1842,18 @@ async def activate_workflow_from_canvas(
             success=True,
             workflow_id=workflow_id,
             workflow_name=request.workflow_name,
-            message="Workflow activated successfully"
+            message="Workflow activated successfully",
+            timestamp=now
         )
 
     except Exception as e:
-        error_id = str(uuid.uuid4())[:8]
+        error_id = secrets.token_hex(4)
         logger.error(f"Failed to activate workflow [error_id={error_id}]: {e}", exc_info=True)
-        raise HTTPException(
+        raise WorkflowError(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "success": False,
-                "error": {
-                    "code": "INTERNAL_ERROR",
-                    "message": "Failed to activate workflow",
-                    "details": f"Error ID: {error_id}",
-                    "retry": True
-                },
-                "timestamp": datetime.now(UTC).isoformat()
-            }
+            code="INTERNAL_ERROR",
+            message="Failed to activate workflow",
+            details=f"Error ID: {error_id}",
+            retry=True,
+            timestamp=now
         )
@@ -7,6 +7,11 @@ from pydantic import Field, field_validator, model_validator
 from typing import Optional
 import re
 
+# Neo WIF: 'K' or 'L' followed by 51 Base58 characters (52 in total)
+_WIF_RE = re.compile(r"^[KL][1-9A-HJ-NP-Za-km-z]{51}$")
+# Ethereum address: 0x followed by 40 hex characters
+_ETHEREUM_ADDRESS_RE = re.compile(r"^0x[a-fA-F0-9]{40}$")
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables"""
@@ -16,6 +21,7 @@ class Settings(BaseSettings):
     environment: str = "development"
     debug: bool = True
     spica_demo_mode: bool = False  # Enable demo mode to bypass x402 payments
+    enable_docs: bool = True  # Serve /docs, /redoc and /openapi.json (disable in production)
 
     # LLM Configuration
     openai_api_key: str = Field(
@@ -59,14 +65,22 @@ class Settings(BaseSettings):
     # Storage
     workflows_dir: str = "./workflows"
 
+    # Key for the workflow_spec_token returned by /parse. Must be the same on
+    # every worker/instance; when unset each process uses a random key, so a
+    # token only skips validation on the worker that issued it.
+    workflow_spec_token_secret: Optional[str] = Field(
+        None,
+        min_length=32,
+        description="HMAC key for workflow_spec_token (shared across workers)"
+    )
+
     @field_validator("demo_wallet_wif")
     @classmethod
     def validate_wif(cls, v: str) -> str:
         """Validate Neo N3 WIF format"""
         if not v:
             raise ValueError("demo_wallet_wif is required")
-        # Neo WIF starts with 'K' or 'L' and is 52 characters
-        if not re.match(r"^[KL][1-9A-HJ-NP-Za-km-z]{51}$", v):
+        if not _WIF_RE.match(v):
             raise ValueError(
                 "Invalid Neo N3 WIF format. Must start with K or L and be 52 characters."
             )
@@ -78,8 +92,7 @@ class Settings(BaseSettings):
         """Validate Ethereum address format"""
         if v is None:
             return None
-        # Ethereum address: 0x followed by 40 hex characters
-        if not re.match(r"^0x[a-fA-F0-9]{40}$", v):
+        if not _ETHEREUM_ADDRESS_RE.match(v):
             raise ValueError(
                 "Invalid Ethereum address format. Must be 0x followed by 40 hex characters."
             )
@@ -1,110 +1,217 @@
 """
 Spica - AI-Powered DeFi Workflow Builder for Neo N3
 FastAPI application entry point
+
+Production runs under `uvicorn app.main:app --loop uvloop --http httptools`
+(see Dockerfile.prod). Both come with uvicorn[standard]; the event loop is
+left to uvicorn rather than installed here so tests and tools that import
+the app keep their own loop.
 """
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 from datetime import datetime, UTC
+import asyncio
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import time
 
 from app.api import router as api_router
+from app.api.v1.workflow import (
+    WorkflowError,
+    workflow_error_handler,
+    rate_limit_middleware,
+)
+from app.services.execution_storage import get_execution_storage, close_execution_storage
+from app.services.neo_rpc import get_neo_rpc, close_neo_rpc
+from app.services.price_monitor import get_price_monitor, close_price_monitor
+from app.services.workflow_scheduler import get_workflow_scheduler
+from app.middleware import micro_cache_middleware, single_flight_middleware
+from app.config import settings
 from app.__version__ import __version__
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+# Configure logging. Records are put on a queue and written to stderr by a
+# QueueListener thread, so handlers on the event loop never block on I/O.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 )
+_log_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# Only merge args/traceback into the message; the listener adds the prefix
+_log_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+logging.basicConfig(level=logging.INFO, handlers=[_log_queue_handler])
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Application lifespan manager - handles startup and shutdown"""
-    # ========================================================================
-    # STARTUP
-    # ========================================================================
-    logger.info("Starting Spica API...")
+# Upper bound for each shutdown step, so one hung close (e.g. a stuck RPC
+# socket) can't stall the rest of shutdown until the process is killed
+SHUTDOWN_STEP_TIMEOUT_SECONDS = 5.0
 
-    # Initialize Neo RPC
+
+async def _start_neo_rpc() -> None:
+    """Connect to Neo RPC and log the current block height."""
     try:
-        from app.services.neo_rpc import get_neo_rpc
         rpc = await get_neo_rpc()
         block_count = await rpc.get_block_count()
         logger.info(f"✓ Neo RPC connected, block height: {block_count}")
     except Exception as e:
         logger.warning(f"✗ Neo RPC initialization failed: {e}")
 
-    # Initialize price monitor
+
+async def _start_price_monitor() -> None:
+    """Initialize the price monitor."""
     try:
-        from app.services.price_monitor import get_price_monitor
         monitor = await get_price_monitor()
         logger.info(f"✓ Price monitor initialized, source: {monitor.source.value}")
     except Exception as e:
         logger.warning(f"✗ Price monitor initialization failed: {e}")
 
-    # Initialize workflow scheduler
+
+async def _start_execution_storage() -> None:
+    """Initialize execution storage."""
+    try:
+        await get_execution_storage()
+        logger.info("✓ Execution storage initialized")
+    except Exception as e:
+        logger.warning(f"✗ Execution storage initialization failed: {e}")
+
+
+async def _start_workflow_scheduler() -> None:
+    """Start the workflow scheduler."""
     try:
-        from app.services.workflow_scheduler import get_workflow_scheduler
         scheduler = await get_workflow_scheduler()
         await scheduler.start()
         logger.info("✓ Workflow scheduler started")
     except Exception as e:
         logger.warning(f"✗ Scheduler initialization failed: {e}")
 
-    # Initialize execution storage
-    try:
-        from app.services.execution_storage import get_execution_storage
-        storage = await get_execution_storage()
-        logger.info("✓ Execution storage initialized")
-    except Exception as e:
-        logger.warning(f"✗ Execution storage initialization failed: {e}")
 
-    logger.info("✓ Spica API startup complete")
+# Startup dependency graph: each service starts as soon as the services it
+# lists are ready, so independent ones connect concurrently. The scheduler
+# only reads prices, so it doesn't wait on Neo RPC or execution storage.
+STARTUP_DEPENDENCIES = {
+    "neo_rpc": (),
+    "price_monitor": (),
+    "execution_storage": (),
+    "workflow_scheduler": ("price_monitor",),
+}
 
-    yield
+_STARTUP_STEPS = {
+    "neo_rpc": _start_neo_rpc,
+    "price_monitor": _start_price_monitor,
+    "execution_storage": _start_execution_storage,
+    "workflow_scheduler": _start_workflow_scheduler,
+}
 
-    # ========================================================================
-    # SHUTDOWN
-    # ========================================================================
-    logger.info("Shutting down Spica API...")
 
-    # Stop workflow scheduler
+async def _start_services() -> None:
+    """
+    Start every service in STARTUP_DEPENDENCIES order.
+
+    Each service waits on its dependencies' ready events, starts, then sets
+    its own event. Start steps log and swallow their own failures, so a
+    failed dependency still releases its dependents, as before.
+    """
+    ready = {name: asyncio.Event() for name in STARTUP_DEPENDENCIES}
+
+    async def start(name: str) -> None:
+        await asyncio.gather(*(ready[dep].wait() for dep in STARTUP_DEPENDENCIES[name]))
+        try:
+            await _STARTUP_STEPS[name]()
+        finally:
+            ready[name].set()
+
+    await asyncio.gather(*(start(name) for name in STARTUP_DEPENDENCIES))
+
+
+async def _stop_workflow_scheduler() -> None:
+    """Stop the workflow scheduler."""
     try:
-        from app.services.workflow_scheduler import get_workflow_scheduler
         scheduler = await get_workflow_scheduler()
-        await scheduler.stop()
+        await asyncio.wait_for(scheduler.stop(), timeout=SHUTDOWN_STEP_TIMEOUT_SECONDS)
         logger.info("✓ Workflow scheduler stopped")
+    except asyncio.TimeoutError:
+        logger.error(f"✗ Timed out stopping scheduler after {SHUTDOWN_STEP_TIMEOUT_SECONDS}s")
     except Exception as e:
         logger.error(f"✗ Error stopping scheduler: {e}")
 
-    # Close price monitor
+
+async def _close_price_monitor() -> None:
+    """Close the price monitor."""
     try:
-        from app.services.price_monitor import close_price_monitor
-        await close_price_monitor()
+        await asyncio.wait_for(close_price_monitor(), timeout=SHUTDOWN_STEP_TIMEOUT_SECONDS)
         logger.info("✓ Price monitor closed")
+    except asyncio.TimeoutError:
+        logger.error(f"✗ Timed out closing price monitor after {SHUTDOWN_STEP_TIMEOUT_SECONDS}s")
     except Exception as e:
         logger.error(f"✗ Error closing price monitor: {e}")
 
-    # Close Neo RPC
+
+async def _close_neo_rpc() -> None:
+    """Close the Neo RPC client."""
     try:
-        from app.services.neo_rpc import close_neo_rpc
-        await close_neo_rpc()
+        await asyncio.wait_for(close_neo_rpc(), timeout=SHUTDOWN_STEP_TIMEOUT_SECONDS)
         logger.info("✓ Neo RPC closed")
+    except asyncio.TimeoutError:
+        logger.error(f"✗ Timed out closing Neo RPC after {SHUTDOWN_STEP_TIMEOUT_SECONDS}s")
     except Exception as e:
         logger.error(f"✗ Error closing Neo RPC: {e}")
 
-    # Close execution storage
+
+async def _close_execution_storage() -> None:
+    """Close execution storage."""
     try:
-        from app.services.execution_storage import close_execution_storage
-        await close_execution_storage()
+        await asyncio.wait_for(close_execution_storage(), timeout=SHUTDOWN_STEP_TIMEOUT_SECONDS)
         logger.info("✓ Execution storage closed")
+    except asyncio.TimeoutError:
+        logger.error(f"✗ Timed out closing execution storage after {SHUTDOWN_STEP_TIMEOUT_SECONDS}s")
     except Exception as e:
         logger.error(f"✗ Error closing execution storage: {e}")
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan manager - handles startup and shutdown"""
+    # ========================================================================
+    # STARTUP
+    # ========================================================================
+    logger.info("Starting Spica API...")
+
+    await _start_services()
+
+    # Build the OpenAPI schema now (FastAPI caches it) so the first docs
+    # request doesn't walk every model
+    if app.openapi_url:
+        app.openapi()
+
+    logger.info("✓ Spica API startup complete")
+
+    yield
+
+    # ========================================================================
+    # SHUTDOWN
+    # ========================================================================
+    logger.info("Shutting down Spica API...")
+
+    # Stop the scheduler first so nothing uses the services being closed
+    await _stop_workflow_scheduler()
+
+    await asyncio.gather(
+        _close_price_monitor(),
+        _close_neo_rpc(),
+        _close_execution_storage(),
+    )
+
     logger.info("✓ Spica API shutdown complete")
 
 
@@ -113,9 +220,10 @@ app = FastAPI(
     description="AI-Powered DeFi Workflow Builder for Neo N3",
     version=__version__,
     lifespan=lifespan,
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/openapi.json"
+    docs_url="/docs" if settings.enable_docs else None,
+    redoc_url="/redoc" if settings.enable_docs else None,
+    openapi_url="/openapi.json" if settings.enable_docs else None,
+    default_response_class=ORJSONResponse,
 )
 
 # Build CORS origins from environment + defaults
@@ -132,10 +240,27 @@ if _env_origins:
 
 logger.info(f"CORS allowed origins: {_default_origins}")
 
-# CORS middleware for frontend
+# Compress only bodies large enough to benefit (workflow lists, graphs);
+# small liveness/status JSON is sent as-is. Registered first so it sits
+# innermost and sees each route's complete body: the "http" middlewares
+# below re-stream responses in chunks, which would defeat minimum_size.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Micro-cache liveness GETs and coalesce concurrent detailed health checks;
+# registered before CORS so reused responses still get CORS headers
+app.middleware("http")(micro_cache_middleware)
+app.middleware("http")(single_flight_middleware)
+
+# Rate-limit parse/generate before their request bodies are read. Registered
+# before CORS so its 413/429 responses still carry CORS headers.
+app.middleware("http")(rate_limit_middleware)
+
+# CORS middleware for frontend. Origins are passed as a frozenset so the
+# per-request origin check is a hashed lookup; Starlette only tests
+# membership on it, and the CORS_ORIGINS extension keeps working.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=_default_origins,
+    allow_origins=frozenset(_default_origins),
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=[
@@ -156,6 +281,29 @@ app.add_middleware(
 # Include API routes
 app.include_router(api_router)
 
+# Structured workflow API errors, rendered with orjson
+app.add_exception_handler(WorkflowError, workflow_error_handler)
+
+
+# (whole second, ISO string) backing the root/legacy health timestamps
+_iso_timestamp_cache = (0, "")
+
+
+def _iso_now() -> str:
+    """
+    Current UTC time as an ISO 8601 string at one-second resolution.
+
+    The string is rebuilt only when the second changes, so frequently polled
+    liveness endpoints don't construct and format a datetime on every hit.
+    """
+    global _iso_timestamp_cache
+    second = int(time.time())
+    cached_second, timestamp = _iso_timestamp_cache
+    if second != cached_second:
+        timestamp = datetime.fromtimestamp(second, UTC).isoformat()
+        _iso_timestamp_cache = (second, timestamp)
+    return timestamp
+
 
 @app.get("/")
 async def root():
@@ -169,7 +317,7 @@ async def root():
         "status": "ok",
         "service": "Spica API",
         "version": __version__,
-        "timestamp": datetime.now(UTC).isoformat(),
+        "timestamp": _iso_now(),
         "docs": "/docs",
         "health": "/api/health"
     }
@@ -186,5 +334,5 @@ async def legacy_health():
     return {
         "status": "healthy",
         "message": "Use /api/health or /api/v1/health for detailed status",
-        "timestamp": datetime.now(UTC).isoformat()
+        "timestamp": _iso_now()
     }
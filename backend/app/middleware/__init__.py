@@ -7,9 +7,12 @@ from .payment_middleware import (
     require_payment,
     create_402_response,
 )
+from .cache_middleware import micro_cache_middleware, single_flight_middleware
 
 __all__ = [
     "PaymentRequired",
     "require_payment",
     "create_402_response",
+    "micro_cache_middleware",
+    "single_flight_middleware",
 ]
@@ -0,0 +1,136 @@
+"""
+Response reuse for the health endpoints.
+
+Load balancers and orchestrators poll `/`, `/health` and `/api/health`
+many times per second. Their bodies only change when the second-resolution
+timestamp does, so a successful response is kept for up to a second and
+replayed to every caller in that window, and clients that send a matching
+If-None-Match get an empty 304 instead of the body.
+
+The detailed `/api/v1/health` check pings Neo RPC and the price monitor, so
+concurrent identical requests are coalesced into a single in-flight check
+whose response every waiter receives.
+"""
+
+import asyncio
+import hashlib
+import time
+from typing import Dict, List, Tuple
+
+from fastapi import Request
+from starlette.responses import Response
+
+# Liveness routes whose GET responses are micro-cached
+MICRO_CACHED_PATHS = frozenset({"/", "/health", "/api/health"})
+MICRO_CACHE_TTL_SECONDS = 1.0
+
+# (path, encoding) -> (expires_at, body, etag, raw_headers), where encoding is
+# "gzip" or "identity" (see _response_encoding). A gzip-encoded body is only
+# replayed to clients that accept gzip, with its original Content-Encoding,
+# and the cache never holds more than two entries per path.
+_micro_cache: Dict[Tuple[str, str], Tuple[float, bytes, str, List[Tuple[bytes, bytes]]]] = {}
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header value against an entity tag."""
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip() for tag in if_none_match.split(","))
+
+
+def _response_encoding(request: Request) -> str:
+    """
+    Reduce Accept-Encoding to the encoding GZipMiddleware will pick.
+
+    Uses the same substring test as GZipMiddleware, so the cache key only
+    varies where the response does, whatever header value the client sends.
+    """
+    return "gzip" if "gzip" in request.headers.get("accept-encoding", "") else "identity"
+
+
+def _replay(status_code: int, body: bytes, raw_headers: List[Tuple[bytes, bytes]]) -> Response:
+    """Rebuild a consumed response from its status, body and raw headers."""
+    response = Response(content=body, status_code=status_code)
+    response.raw_headers = list(raw_headers)
+    return response
+
+
+async def micro_cache_middleware(request: Request, call_next):
+    """
+    Serve liveness GETs from a one-second cache, answering 304 on ETag match.
+
+    Runs as HTTP middleware so cache hits skip routing and serialization.
+    Only 200 responses are cached; anything else passes through untouched.
+    Replays carry the original response's full header set.
+    """
+    path = request.url.path
+    if request.method != "GET" or path not in MICRO_CACHED_PATHS:
+        return await call_next(request)
+
+    now = time.monotonic()
+    key = (path, _response_encoding(request))
+    entry = _micro_cache.get(key)
+
+    if entry is None or entry[0] <= now:
+        response = await call_next(request)
+        if response.status_code != 200:
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        etag = f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        raw_headers = [(k, v) for k, v in response.raw_headers if k != b"etag"]
+        raw_headers.append((b"etag", etag.encode("latin-1")))
+        entry = (now + MICRO_CACHE_TTL_SECONDS, body, etag, raw_headers)
+        _micro_cache[key] = entry
+
+    _, body, etag, raw_headers = entry
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return _replay(200, body, raw_headers)
+
+
+# Health checks that call out to dependencies; concurrent GETs share one run
+SINGLE_FLIGHT_PATHS = frozenset({"/api/v1/health"})
+
+# (path, query, Accept-Encoding) -> future resolving to
+# (status_code, body, raw_headers), or None when the leading request failed
+_in_flight: Dict[Tuple[str, str, str], asyncio.Future] = {}
+
+
+async def single_flight_middleware(request: Request, call_next):
+    """
+    Coalesce concurrent identical GETs to the dependency health checks.
+
+    The first request runs the handler; requests arriving while it is in
+    flight await its result and receive a copy of the same response. If the
+    leading request fails, waiters fall back to running the handler
+    themselves. Only requests with the same Accept-Encoding share a
+    response, which is replayed with its full header set.
+    """
+    path = request.url.path
+    if request.method != "GET" or path not in SINGLE_FLIGHT_PATHS:
+        return await call_next(request)
+
+    key = (path, request.url.query, request.headers.get("accept-encoding", ""))
+    pending = _in_flight.get(key)
+    if pending is not None:
+        result = await asyncio.shield(pending)
+        if result is None:
+            return await call_next(request)
+        return _replay(*result)
+
+    future = asyncio.get_running_loop().create_future()
+    _in_flight[key] = future
+    result = None
+    try:
+        response = await call_next(request)
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        result = (response.status_code, body, list(response.raw_headers))
+    finally:
+        del _in_flight[key]
+        future.set_result(result)
+
+    return _replay(*result)
@@ -9,12 +9,14 @@ This middleware handles:
 """
 
 import base64
+import functools
 import json
 import logging
 from typing import Optional
 
+import orjson
 from fastapi import Header, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from app.services.payment_service import get_payment_service
 from app.models.payment_models import PaymentVerificationResult
@@ -23,6 +25,27 @@ from app.config import settings
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# Payment Request Encoding
+# ============================================================================
+
+@functools.lru_cache(maxsize=256)
+def _encode_payment_json(payment_json: str) -> str:
+    """Base64-encode a serialized payment request, memoized per request body."""
+    return base64.b64encode(payment_json.encode()).decode()
+
+
+def _encode_payment_request(payment_request: dict) -> str:
+    """
+    Encode a payment request as base64 JSON for the X-PAYMENT-REQUEST header (x402 spec).
+
+    A workflow's payment request is deterministic, so clients that keep probing
+    without paying get the previously encoded header instead of a fresh base64
+    pass per 402 response.
+    """
+    return _encode_payment_json(json.dumps(payment_request))
+
+
 # ============================================================================
 # Payment Exception
 # ============================================================================
@@ -54,13 +77,9 @@ class PaymentRequired(HTTPException):
         """
         self.payment_request = payment_request
 
-        # Encode payment request as base64 JSON (x402 spec)
-        payment_json = json.dumps(payment_request)
-        payment_b64 = base64.b64encode(payment_json.encode()).decode()
-
         # Build response headers
         response_headers = {
-            "X-PAYMENT-REQUEST": payment_b64,
+            "X-PAYMENT-REQUEST": _encode_payment_request(payment_request),
         }
         if headers:
             response_headers.update(headers)
@@ -120,7 +139,26 @@ async def require_payment(
 # Utility Functions
 # ============================================================================
 
-def create_402_response(payment_request: dict, detail: str = "Payment required") -> JSONResponse:
+@functools.lru_cache(maxsize=64)
+def _payment_required_body(detail: str) -> bytes:
+    """
+    Serialized 402 error body, memoized per detail message.
+
+    Only the X-PAYMENT-REQUEST header differs between 402s; the body varies
+    with a handful of fixed detail messages, so it is encoded once each.
+    """
+    return orjson.dumps({
+        "success": False,
+        "error": {
+            "code": "PAYMENT_REQUIRED",
+            "message": detail,
+            "details": "Include X-PAYMENT header with payment proof to proceed",
+            "retry": True
+        }
+    })
+
+
+def create_402_response(payment_request: dict, detail: str = "Payment required") -> Response:
     """
     Create a 402 Payment Required response with X-PAYMENT-REQUEST header.
 
@@ -129,7 +167,7 @@ def create_402_response(payment_request: dict, detail: str = "Payment required")
         detail: Error detail message
 
     Returns:
-        JSONResponse with 402 status and X-PAYMENT-REQUEST header
+        Response with 402 status and X-PAYMENT-REQUEST header
 
     Usage:
         ```python
@@ -137,23 +175,12 @@ def create_402_response(payment_request: dict, detail: str = "Payment required")
         return create_402_response(payment_request)
         ```
     """
-    # Encode payment request as base64 JSON (x402 spec)
-    payment_json = json.dumps(payment_request)
-    payment_b64 = base64.b64encode(payment_json.encode()).decode()
-
-    response = JSONResponse(
+    response = Response(
+        content=_payment_required_body(detail),
+        media_type="application/json",
         status_code=status.HTTP_402_PAYMENT_REQUIRED,
-        content={
-            "success": False,
-            "error": {
-                "code": "PAYMENT_REQUIRED",
-                "message": detail,
-                "details": "Include X-PAYMENT header with payment proof to proceed",
-                "retry": True
-            }
-        },
         headers={
-            "X-PAYMENT-REQUEST": payment_b64,
+            "X-PAYMENT-REQUEST": _encode_payment_request(payment_request),
         }
     )
 
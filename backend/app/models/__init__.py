@@ -13,6 +13,7 @@ from .api_models import (
     PaginatedResponse,
     HealthStatus,
     ServiceStatusValue,
+    utc_now,
 )
 from .error_codes import ErrorCode
 from .workflow_models import (
@@ -31,7 +32,7 @@ from .workflow_models import (
     ParserSuccess,
     ParserError,
     ParserResponse,
-    EXAMPLE_WORKFLOWS,
+    get_example_workflows,
 )
 from .graph_models import (
     WorkflowState,
@@ -79,6 +80,7 @@ __all__ = [
     "ParserError",
     "ParserResponse",
     "EXAMPLE_WORKFLOWS",
+    "get_example_workflows",
     # Graph models
     "WorkflowState",
     "GraphNode",
@@ -93,3 +95,10 @@ __all__ = [
     "PaymentRequestData",
     "PaymentVerificationResult",
 ]
+
+
+def __getattr__(name):
+    # EXAMPLE_WORKFLOWS is built on first access, see workflow_models
+    if name == "EXAMPLE_WORKFLOWS":
+        return get_example_workflows()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,12 +2,18 @@
 Pydantic models for API request/response schemas
 """
 
+import functools
 from typing import Optional, Dict, Any, List
 from enum import Enum
 from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime, UTC
 
 
+# Shared default_factory for UTC timestamps across the model modules: one
+# bound callable instead of a lambda per field
+utc_now = functools.partial(datetime.now, UTC)
+
+
 class HealthStatus(str, Enum):
     """Overall system health status"""
     HEALTHY = "healthy"
@@ -26,7 +32,7 @@ class BaseResponse(BaseModel):
     """Base response model for all API endpoints"""
     success: bool = Field(..., description="Indicates if the request was successful")
     message: Optional[str] = Field(None, description="Optional message for additional context")
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC), description="Response timestamp")
+    timestamp: datetime = Field(default_factory=utc_now, description="Response timestamp")
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -62,7 +68,7 @@ class ErrorResponse(BaseModel):
     """Error response model"""
     success: bool = Field(False, description="Always false for errors")
     error: ErrorDetail = Field(..., description="Error details")
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC), description="Error timestamp")
+    timestamp: datetime = Field(default_factory=utc_now, description="Error timestamp")
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -85,7 +91,7 @@ class HealthCheckResponse(BaseModel):
     status: ServiceStatusValue = Field(..., description="Overall service status")
     service: str = Field(..., description="Service name")
     version: str = Field(..., description="Service version")
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC), description="Health check timestamp")
+    timestamp: datetime = Field(default_factory=utc_now, description="Health check timestamp")
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -124,7 +130,7 @@ class DetailedHealthResponse(BaseModel):
         default_factory=dict,
         description="Status of dependent services"
     )
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC), description="Health check timestamp")
+    timestamp: datetime = Field(default_factory=utc_now, description="Health check timestamp")
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -7,8 +7,9 @@ StateGraph workflows and React Flow visualizations.
 
 from typing import TypedDict, Dict, Any, List, Optional, Literal
 from pydantic import BaseModel, Field
-from datetime import datetime, timezone
+from datetime import datetime
 
+from app.models.api_models import utc_now
 from app.models.workflow_models import WorkflowSpec
 
 
@@ -21,7 +22,10 @@ class WorkflowState(TypedDict):
     TypedDict state for SpoonOS StateGraph execution.
 
     This state is passed between nodes during workflow execution.
-    Each node receives this state and returns updates to merge.
+    Each node receives this state and returns updates to merge. StateGraph
+    merges updates into the state in place and appends list updates to the
+    existing list, so nodes return only their new `completed_steps` /
+    `step_results` entries rather than copies of the whole history.
 
     State Fields:
     - workflow_id: Unique identifier for the workflow instance
@@ -125,7 +129,7 @@ class AssembledGraph(BaseModel):
     )
 
     # Metadata
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=utc_now)
     version: str = Field(default="1.0", description="Graph schema version")
 
     class Config:
@@ -165,9 +169,13 @@ class StoredWorkflow(BaseModel):
     last_executed_at: Optional[datetime] = Field(None, description="Last execution timestamp")
     last_error: Optional[str] = Field(None, description="Last error message if any")
 
+    # Trigger display fields, computed when the workflow is written
+    trigger_type: Optional[str] = Field(None, description="Trigger type (price/time/manual)")
+    trigger_summary: Optional[str] = Field(None, description="Human-readable trigger summary")
+
     # Timestamps
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
 
     class Config:
         json_encoders = {
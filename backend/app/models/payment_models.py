@@ -5,12 +5,12 @@ Defines pricing models and payment request structures for workflow execution.
 """
 
 from decimal import Decimal
-from enum import Enum
-from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field
+from enum import StrEnum
+from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class PaymentErrorCode(str, Enum):
+class PaymentErrorCode(StrEnum):
     """
     Standardized error codes for payment verification failures.
 
@@ -33,7 +33,7 @@ class PaymentErrorCode(str, Enum):
     PAYMENT_VERIFICATION_ERROR = "PAYMENT_VERIFICATION_ERROR"
 
 
-class WorkflowComplexity(str, Enum):
+class WorkflowComplexity(StrEnum):
     """
     Workflow complexity levels for pricing calculation.
 
@@ -65,12 +65,14 @@ class WorkflowPricing(BaseModel):
 
     def get_price(self, complexity: WorkflowComplexity) -> Decimal:
         """Get price for a given complexity level"""
-        price_map = {
-            WorkflowComplexity.SIMPLE: self.SIMPLE_PRICE,
-            WorkflowComplexity.TRIGGERED: self.TRIGGERED_PRICE,
-            WorkflowComplexity.COMPLEX: self.COMPLEX_PRICE,
-        }
-        return price_map[complexity]
+        match complexity:
+            case WorkflowComplexity.SIMPLE:
+                return self.SIMPLE_PRICE
+            case WorkflowComplexity.TRIGGERED:
+                return self.TRIGGERED_PRICE
+            case WorkflowComplexity.COMPLEX:
+                return self.COMPLEX_PRICE
+        raise KeyError(complexity)
 
 
 class PaymentRequestData(BaseModel):
@@ -108,6 +110,39 @@ class PaymentRequestData(BaseModel):
         }
 
 
+class EIP3009Authorization(BaseModel):
+    """
+    EIP-3009 transferWithAuthorization parameters signed by the payer.
+
+    Fields are optional so PaymentService can report each missing one with
+    its own error code instead of failing the whole header decode. Unknown
+    keys are kept, so an authorization object that only has unknown keys
+    still counts as present, as it did when this was a plain dict.
+    """
+    model_config = ConfigDict(populate_by_name=True, coerce_numbers_to_str=True, extra="allow")
+
+    from_: Optional[str] = Field(None, alias="from", description="Payer address")
+    to: Optional[str] = Field(None, description="Receiver address")
+    value: Optional[str] = Field(None, description="Amount in atomic units")
+    validAfter: Optional[str] = Field(None, description="Unix timestamp the authorization becomes valid")
+    validBefore: Optional[str] = Field(None, description="Unix timestamp the authorization expires")
+    nonce: Optional[str] = Field(None, description="Authorization nonce")
+
+
+class ExactSchemePayload(BaseModel):
+    """
+    Payload of an x402 'exact' scheme payment.
+
+    Unknown keys are kept (and counted in model_fields_set), so a payload
+    with only unknown keys is reported as missing its authorization rather
+    than missing entirely, as it was when this was a plain dict.
+    """
+    model_config = ConfigDict(extra="allow")
+
+    signature: Optional[str] = Field(None, description="Payer signature over the authorization")
+    authorization: Optional[EIP3009Authorization] = Field(None, description="Signed transfer authorization")
+
+
 class PaymentPayload(BaseModel):
     """
     Decoded x402 payment payload from X-PAYMENT header.
@@ -117,7 +152,7 @@ class PaymentPayload(BaseModel):
     x402Version: int = Field(..., description="x402 protocol version (should be 1)")
     scheme: str = Field(..., description="Payment scheme (e.g., 'exact')")
     network: str = Field(..., description="Blockchain network (e.g., 'base-sepolia')")
-    payload: Dict[str, Any] = Field(..., description="Payment signature and authorization")
+    payload: ExactSchemePayload = Field(..., description="Payment signature and authorization")
 
     class Config:
         json_schema_extra = {
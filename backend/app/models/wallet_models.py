@@ -5,7 +5,9 @@ Pydantic models for wallet-related API schemas
 from typing import Optional
 from decimal import Decimal
 from pydantic import BaseModel, Field, ConfigDict
-from datetime import datetime, UTC
+from datetime import datetime
+
+from app.models.api_models import utc_now
 
 
 class WalletBalance(BaseModel):
@@ -34,7 +36,7 @@ class WalletInfo(BaseModel):
     )
     network: str = Field(default="testnet", description="Network: testnet or mainnet")
     timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(UTC),
+        default_factory=utc_now,
         description="Timestamp when wallet info was retrieved"
     )
 
@@ -67,7 +69,7 @@ class WalletResponse(BaseModel):
     data: Optional[WalletInfo] = Field(None, description="Wallet information")
     message: Optional[str] = Field(None, description="Optional message")
     timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(UTC),
+        default_factory=utc_now,
         description="Response timestamp"
     )
 
@@ -5,30 +5,43 @@ These models define the structure of workflows that users can create
 using natural language descriptions.
 """
 
-from typing import Literal, Optional, Union, List
-from pydantic import BaseModel, Field, field_validator
-from enum import Enum
+import functools
+import hashlib
+from typing import TYPE_CHECKING, Annotated, Any, Dict, Literal, Optional, Union, List
+from pydantic import BaseModel, Field, field_validator, model_validator
+from enum import StrEnum
+
+try:
+    import base58
+except ImportError:
+    base58 = None
+
+# Bound once for the address checksum (OpenSSL-backed one-shot constructor)
+_sha256 = hashlib.sha256
+
+# Base58 (Bitcoin alphabet) characters valid in a Neo N3 address
+_BASE58_CHARS = frozenset("123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz")
 
 
 # ============================================================================
 # Enums for supported types
 # ============================================================================
 
-class TokenType(str, Enum):
+class TokenType(StrEnum):
     """Supported token types in Spica workflows"""
     GAS = "GAS"
     NEO = "NEO"
     BNEO = "bNEO"
 
 
-class ActionType(str, Enum):
+class ActionType(StrEnum):
     """Supported action types in Spica workflows"""
     SWAP = "swap"
     STAKE = "stake"
     TRANSFER = "transfer"
 
 
-class TriggerType(str, Enum):
+class TriggerType(StrEnum):
     """Supported trigger types in Spica workflows"""
     PRICE = "price"
     TIME = "time"
@@ -56,19 +69,51 @@ class TimeCondition(BaseModel):
     @field_validator('schedule')
     @classmethod
     def validate_schedule(cls, v: str) -> str:
-        if not v or not v.strip():
+        v = v.strip()
+        if not v:
             raise ValueError("Schedule cannot be empty")
-        return v.strip()
+        return v
 
 
-TriggerCondition = Union[PriceCondition, TimeCondition]
+TriggerCondition = Annotated[Union[PriceCondition, TimeCondition], Field(discriminator="type")]
 
 
 # ============================================================================
 # Action Models
 # ============================================================================
 
-class SwapAction(BaseModel):
+class _AmountOrPercentage(BaseModel):
+    """
+    Base for actions sized by exactly one of `amount` or `percentage`.
+
+    Subclasses declare both fields themselves, after their own fields, so
+    each action keeps its field order and field descriptions. Declaring them
+    here would move them to the front of every subclass. A subclass missing
+    either field is rejected when the class is defined.
+    """
+
+    if TYPE_CHECKING:
+        amount: Optional[float]
+        percentage: Optional[float]
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        missing = {"amount", "percentage"} - cls.model_fields.keys()
+        if missing:
+            raise TypeError(f"{cls.__name__} must declare {', '.join(sorted(missing))}")
+
+    @model_validator(mode="after")
+    def _check_amount_or_percentage(self):
+        """Validate that amount and percentage are mutually exclusive"""
+        if (self.amount is None) == (self.percentage is None):
+            if self.amount is None:
+                raise ValueError("Must specify either amount or percentage")
+            raise ValueError("Cannot specify both amount and percentage")
+        return self
+
+
+class SwapAction(_AmountOrPercentage):
     """Swap one token for another"""
     type: Literal["swap"] = "swap"
     from_token: TokenType = Field(..., description="Token to swap from")
@@ -76,33 +121,64 @@ class SwapAction(BaseModel):
     amount: Optional[float] = Field(None, gt=0, description="Amount to swap (optional, can be percentage)")
     percentage: Optional[float] = Field(None, gt=0, le=100, description="Percentage of balance to swap")
 
-
-    def model_post_init(self, __context) -> None:
-        """Validate that from_token != to_token and amount/percentage are mutually exclusive"""
+    @model_validator(mode="after")
+    def _check_distinct_tokens(self):
+        """Validate that from_token != to_token"""
         if self.from_token == self.to_token:
             raise ValueError("Cannot swap a token to itself")
-        if self.amount is not None and self.percentage is not None:
-            raise ValueError("Cannot specify both amount and percentage")
-        if self.amount is None and self.percentage is None:
-            raise ValueError("Must specify either amount or percentage")
+        return self
 
 
-class StakeAction(BaseModel):
+class StakeAction(_AmountOrPercentage):
     """Stake tokens"""
     type: Literal["stake"] = "stake"
     token: TokenType = Field(..., description="Token to stake")
     amount: Optional[float] = Field(None, gt=0, description="Amount to stake")
     percentage: Optional[float] = Field(None, gt=0, le=100, description="Percentage of balance to stake")
 
-    def model_post_init(self, __context) -> None:
-        """Validate that amount and percentage are mutually exclusive"""
-        if self.amount is not None and self.percentage is not None:
-            raise ValueError("Cannot specify both amount and percentage")
-        if self.amount is None and self.percentage is None:
-            raise ValueError("Must specify either amount or percentage")
+
+@functools.lru_cache(maxsize=4096)
+def _neo_address_error(address: str) -> Optional[str]:
+    """
+    Check a stripped Neo N3 address's format, base58 encoding and checksum.
+
+    Returns the validation error message, or None if the address is valid.
+    Memoized per address (the check is deterministic) so repeated addresses
+    skip the base58 decode and double SHA-256.
+    """
+    # Neo N3 addresses start with 'N' and are 34 characters
+    if not address.startswith('N') or len(address) != 34:
+        return "Invalid Neo N3 address format (must start with 'N' and be 34 characters)"
+
+    # Reject non-base58 characters before the big-int decode
+    if not _BASE58_CHARS.issuperset(address):
+        bad = next(c for c in address if c not in _BASE58_CHARS)
+        return f"Invalid Neo N3 address: Invalid character {bad!r}"
+
+    if base58 is None:
+        return "Invalid Neo N3 address: base58 package not installed"
+
+    # Validate base58 encoding and checksum
+    try:
+        decoded = base58.b58decode(address)
+    except Exception as e:
+        return f"Invalid Neo N3 address: {str(e)}"
+
+    if len(decoded) != 25:
+        return "Invalid Neo N3 address: Invalid Neo N3 address length after decoding"
+
+    # Verify checksum (last 4 bytes)
+    data = decoded[:-4]
+    checksum = decoded[-4:]
+    hash_result = _sha256(_sha256(data).digest()).digest()[:4]
+
+    if checksum != hash_result:
+        return "Invalid Neo N3 address: Invalid Neo N3 address checksum"
+
+    return None
 
 
-class TransferAction(BaseModel):
+class TransferAction(_AmountOrPercentage):
     """Transfer tokens to an address"""
     type: Literal["transfer"] = "transfer"
     token: TokenType = Field(..., description="Token to transfer")
@@ -114,45 +190,17 @@ class TransferAction(BaseModel):
     @classmethod
     def validate_address(cls, v: str) -> str:
         """Validate Neo N3 address with checksum verification"""
-        if not v or not v.strip():
-            raise ValueError("Address cannot be empty")
         v = v.strip()
+        if not v:
+            raise ValueError("Address cannot be empty")
 
-        # Neo N3 addresses start with 'N' and are 34 characters
-        if not v.startswith('N') or len(v) != 34:
-            raise ValueError("Invalid Neo N3 address format (must start with 'N' and be 34 characters)")
-
-        # Validate base58 encoding and checksum
-        try:
-            import base58
-            import hashlib
-
-            decoded = base58.b58decode(v)
-            if len(decoded) != 25:
-                raise ValueError("Invalid Neo N3 address length after decoding")
-
-            # Verify checksum (last 4 bytes)
-            data = decoded[:-4]
-            checksum = decoded[-4:]
-            hash_result = hashlib.sha256(hashlib.sha256(data).digest()).digest()[:4]
-
-            if checksum != hash_result:
-                raise ValueError("Invalid Neo N3 address checksum")
-
-        except Exception as e:
-            raise ValueError(f"Invalid Neo N3 address: {str(e)}")
-
+        error = _neo_address_error(v)
+        if error:
+            raise ValueError(error)
         return v
 
-    def model_post_init(self, __context) -> None:
-        """Validate that amount and percentage are mutually exclusive"""
-        if self.amount is not None and self.percentage is not None:
-            raise ValueError("Cannot specify both amount and percentage")
-        if self.amount is None and self.percentage is None:
-            raise ValueError("Must specify either amount or percentage")
 
-
-WorkflowAction = Union[SwapAction, StakeAction, TransferAction]
+WorkflowAction = Annotated[Union[SwapAction, StakeAction, TransferAction], Field(discriminator="type")]
 
 
 # ============================================================================
@@ -161,7 +209,7 @@ WorkflowAction = Union[SwapAction, StakeAction, TransferAction]
 
 class WorkflowStep(BaseModel):
     """A single step in a workflow"""
-    action: WorkflowAction = Field(..., discriminator='type', description="Action to execute")
+    action: WorkflowAction = Field(..., description="Action to execute")
     description: Optional[str] = Field(None, description="Human-readable description of this step")
 
 
@@ -173,22 +221,67 @@ class WorkflowSpec(BaseModel):
     """
     name: str = Field(..., description="User-friendly workflow name")
     description: str = Field(..., description="Description of what this workflow does")
-    trigger: TriggerCondition = Field(..., discriminator='type', description="Condition that triggers this workflow")
+    trigger: TriggerCondition = Field(..., description="Condition that triggers this workflow")
     steps: List[WorkflowStep] = Field(..., min_length=1, description="Ordered list of actions to execute")
 
     @field_validator('name')
     @classmethod
     def validate_name(cls, v: str) -> str:
-        if not v or not v.strip():
+        v = v.strip()
+        if not v:
             raise ValueError("Workflow name cannot be empty")
-        return v.strip()
+        return v
 
     @field_validator('description')
     @classmethod
     def validate_description(cls, v: str) -> str:
-        if not v or not v.strip():
+        v = v.strip()
+        if not v:
             raise ValueError("Workflow description cannot be empty")
-        return v.strip()
+        return v
+
+
+_TRIGGER_MODELS = {"price": PriceCondition, "time": TimeCondition}
+_ACTION_MODELS = {"swap": SwapAction, "stake": StakeAction, "transfer": TransferAction}
+_TOKEN_FIELDS = frozenset({"token", "from_token", "to_token"})
+
+
+def _construct_leaf(model: type[BaseModel], data: Dict[str, Any]) -> BaseModel:
+    """model_construct a trigger/action, restoring its TokenType enums."""
+    return model.model_construct(**{
+        key: TokenType(value) if key in _TOKEN_FIELDS else value
+        for key, value in data.items()
+    })
+
+
+def construct_workflow_spec(data: Dict[str, Any]) -> WorkflowSpec:
+    """
+    Rebuild a WorkflowSpec from its JSON dump without running validation.
+
+    Unlike WorkflowSpec.model_construct, this also builds the nested trigger,
+    step and action models. Only use it for payloads known to be the
+    model_dump(mode="json") of an already-validated spec; anything else must
+    go through model_validate.
+
+    Args:
+        data: JSON-mode dump of a validated WorkflowSpec
+
+    Returns:
+        Equivalent WorkflowSpec instance
+    """
+    trigger = data["trigger"]
+    return WorkflowSpec.model_construct(
+        name=data["name"],
+        description=data["description"],
+        trigger=_construct_leaf(_TRIGGER_MODELS[trigger["type"]], trigger),
+        steps=[
+            WorkflowStep.model_construct(
+                action=_construct_leaf(_ACTION_MODELS[step["action"]["type"]], step["action"]),
+                description=step.get("description")
+            )
+            for step in data["steps"]
+        ]
+    )
 
 
 # ============================================================================
@@ -209,78 +302,95 @@ class ParserError(BaseModel):
     suggestions: List[str] = Field(default_factory=list, description="Suggestions to fix the input")
 
 
-ParserResponse = Union[ParserSuccess, ParserError]
+# Tagged on the `success` literal so callers can branch on result.success and
+# pydantic picks the variant directly instead of trying each in turn
+ParserResponse = Annotated[Union[ParserSuccess, ParserError], Field(discriminator="success")]
 
 
 # ============================================================================
 # Example Workflows for Documentation
 # ============================================================================
 
-EXAMPLE_WORKFLOWS = {
-    "price_swap": WorkflowSpec(
-        name="Auto DCA into NEO",
-        description="When GAS price is below $5, swap 10 GAS for NEO",
-        trigger=PriceCondition(
-            type="price",
-            token=TokenType.GAS,
-            operator="below",
-            value=5.0
-        ),
-        steps=[
-            WorkflowStep(
-                action=SwapAction(
-                    type="swap",
-                    from_token=TokenType.GAS,
-                    to_token=TokenType.NEO,
-                    amount=10.0
-                ),
-                description="Swap 10 GAS to NEO"
-            )
-        ]
-    ),
-    "time_stake": WorkflowSpec(
-        name="Daily NEO Staking",
-        description="Stake 50% of NEO balance daily at 9 AM",
-        trigger=TimeCondition(
-            type="time",
-            schedule="daily at 9am"
+@functools.lru_cache(maxsize=1)
+def get_example_workflows() -> Dict[str, WorkflowSpec]:
+    """
+    Example workflow specs keyed by name, built on first use.
+
+    Kept out of module import so loading the models doesn't validate three
+    full WorkflowSpec trees that only documentation and tests read.
+    """
+    return {
+        "price_swap": WorkflowSpec(
+            name="Auto DCA into NEO",
+            description="When GAS price is below $5, swap 10 GAS for NEO",
+            trigger=PriceCondition(
+                type="price",
+                token=TokenType.GAS,
+                operator="below",
+                value=5.0
+            ),
+            steps=[
+                WorkflowStep(
+                    action=SwapAction(
+                        type="swap",
+                        from_token=TokenType.GAS,
+                        to_token=TokenType.NEO,
+                        amount=10.0
+                    ),
+                    description="Swap 10 GAS to NEO"
+                )
+            ]
         ),
-        steps=[
-            WorkflowStep(
-                action=StakeAction(
-                    type="stake",
-                    token=TokenType.NEO,
-                    percentage=50.0
-                ),
-                description="Stake 50% of NEO balance"
-            )
-        ]
-    ),
-    "multi_step": WorkflowSpec(
-        name="Weekly Portfolio Rebalance",
-        description="Every Monday, swap GAS to NEO and stake it",
-        trigger=TimeCondition(
-            type="time",
-            schedule="every Monday at 10am"
+        "time_stake": WorkflowSpec(
+            name="Daily NEO Staking",
+            description="Stake 50% of NEO balance daily at 9 AM",
+            trigger=TimeCondition(
+                type="time",
+                schedule="daily at 9am"
+            ),
+            steps=[
+                WorkflowStep(
+                    action=StakeAction(
+                        type="stake",
+                        token=TokenType.NEO,
+                        percentage=50.0
+                    ),
+                    description="Stake 50% of NEO balance"
+                )
+            ]
         ),
-        steps=[
-            WorkflowStep(
-                action=SwapAction(
-                    type="swap",
-                    from_token=TokenType.GAS,
-                    to_token=TokenType.NEO,
-                    percentage=30.0
-                ),
-                description="Swap 30% of GAS to NEO"
+        "multi_step": WorkflowSpec(
+            name="Weekly Portfolio Rebalance",
+            description="Every Monday, swap GAS to NEO and stake it",
+            trigger=TimeCondition(
+                type="time",
+                schedule="every Monday at 10am"
             ),
-            WorkflowStep(
-                action=StakeAction(
-                    type="stake",
-                    token=TokenType.NEO,
-                    percentage=100.0
+            steps=[
+                WorkflowStep(
+                    action=SwapAction(
+                        type="swap",
+                        from_token=TokenType.GAS,
+                        to_token=TokenType.NEO,
+                        percentage=30.0
+                    ),
+                    description="Swap 30% of GAS to NEO"
                 ),
-                description="Stake all NEO"
-            )
-        ]
-    )
-}
+                WorkflowStep(
+                    action=StakeAction(
+                        type="stake",
+                        token=TokenType.NEO,
+                        percentage=100.0
+                    ),
+                    description="Stake all NEO"
+                )
+            ]
+        )
+    }
+
+
+def __getattr__(name: str) -> Any:
+    # EXAMPLE_WORKFLOWS stays importable, built lazily (PEP 562)
+    if name == "EXAMPLE_WORKFLOWS":
+        return get_example_workflows()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
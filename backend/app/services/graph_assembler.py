@@ -306,14 +306,8 @@ class GraphAssembler:
             """
             logger.info(f"Evaluating {trigger_type} trigger")
 
-            # Type-safe metadata merge
-            existing_metadata = state.get("metadata", {})
-            if not isinstance(existing_metadata, dict):
-                existing_metadata = {}
-
-            # Base metadata
+            # Base metadata; StateGraph merges it into the existing metadata dict
             base_metadata = {
-                **existing_metadata,
                 "trigger_evaluated_at": datetime.now(timezone.utc).isoformat(),
                 "trigger_type": trigger_type,
             }
@@ -485,34 +479,22 @@ class GraphAssembler:
                 total_steps = state.get("total_steps", 1)
                 is_last_step = step_index >= total_steps - 1
 
-                # Update state with mutation-safe patterns
-                completed_steps = state.get("completed_steps", [])
-                step_results = state.get("step_results", [])
-
-                if not isinstance(completed_steps, list):
-                    completed_steps = []
-                if not isinstance(step_results, list):
-                    step_results = []
-
+                # Return only this step's entries: StateGraph's reducer appends
+                # list updates to the existing state lists in place
                 return {
                     "current_step": step_index + 1,
-                    "completed_steps": [*completed_steps, step_index],
-                    "step_results": [*step_results, step_result],
+                    "completed_steps": [step_index],
+                    "step_results": [step_result],
                     "workflow_status": "completed" if is_last_step else "running",
                 }
 
             except Exception as e:
                 logger.error(f"Action execution error: {e}")
 
-                step_results = state.get("step_results", [])
-                if not isinstance(step_results, list):
-                    step_results = []
-
                 return {
                     "workflow_status": "failed",
                     "error": str(e),
                     "step_results": [
-                        *step_results,
                         {
                             "step": step_index,
                             "action_type": action_type,
@@ -390,8 +390,9 @@ class PaymentService:
                 error_code=PaymentErrorCode.PAYMENT_INVALID_VERSION
             )
 
-        # Verify payload structure
-        if not payment_payload.payload:
+        # Verify payload structure (only an empty payload object sets no
+        # fields; unknown keys count, see ExactSchemePayload)
+        if not payment_payload.payload.model_fields_set:
             return PaymentVerificationResult(
                 is_valid=False,
                 error_reason="Payment payload is missing",
@@ -399,8 +400,8 @@ class PaymentService:
             )
 
         # Verify authorization exists
-        authorization = payment_payload.payload.get("authorization")
-        if not authorization:
+        authorization = payment_payload.payload.authorization
+        if authorization is None or not authorization.model_fields_set:
             return PaymentVerificationResult(
                 is_valid=False,
                 error_reason="Payment authorization is missing",
@@ -408,7 +409,7 @@ class PaymentService:
             )
 
         # Verify signature exists
-        signature = payment_payload.payload.get("signature")
+        signature = payment_payload.payload.signature
         if not signature:
             return PaymentVerificationResult(
                 is_valid=False,
@@ -418,7 +419,7 @@ class PaymentService:
 
         return PaymentVerificationResult(
             is_valid=True,
-            payer=authorization.get("from"),
+            payer=authorization.from_,
         )
 
     def _verify_payment_expiry(self, payment_payload: PaymentPayload) -> PaymentVerificationResult:
@@ -431,8 +432,8 @@ class PaymentService:
         Returns:
             PaymentVerificationResult with expiry check result
         """
-        authorization = payment_payload.payload.get("authorization", {})
-        valid_before = authorization.get("validBefore")
+        authorization = payment_payload.payload.authorization
+        valid_before = authorization.validBefore if authorization else None
 
         if not valid_before:
             return PaymentVerificationResult(
@@ -454,7 +455,7 @@ class PaymentService:
 
             return PaymentVerificationResult(
                 is_valid=True,
-                payer=authorization.get("from"),
+                payer=authorization.from_,
             )
 
         except (ValueError, TypeError) as e:
@@ -479,8 +480,8 @@ class PaymentService:
         Returns:
             PaymentVerificationResult with amount check result
         """
-        authorization = payment_payload.payload.get("authorization", {})
-        payment_value = authorization.get("value")
+        authorization = payment_payload.payload.authorization
+        payment_value = authorization.value if authorization else None
 
         if not payment_value:
             return PaymentVerificationResult(
@@ -505,7 +506,7 @@ class PaymentService:
 
             return PaymentVerificationResult(
                 is_valid=True,
-                payer=authorization.get("from"),
+                payer=authorization.from_,
             )
 
         except (ValueError, TypeError) as e:
@@ -19,20 +19,24 @@ Security Features:
 - Sanitized error messages to prevent information disclosure
 """
 
+import asyncio
 import json
 import logging
 import os
 import re
 import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Literal, Optional, Dict, Any, Tuple, Union
 
-from pydantic import ValidationError
+from pydantic import BaseModel, Field, ValidationError
 from filelock import FileLock, Timeout as FileLockTimeout
 
+from app.models.api_models import utc_now
 from app.models.graph_models import AssembledGraph, StoredWorkflow
-from app.models.workflow_models import WorkflowSpec
+from app.models.workflow_models import WorkflowSpec, TriggerCondition
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +61,161 @@ WORKFLOW_ID_PATTERN = re.compile(r'^wf_[a-zA-Z0-9_-]{1,64}$')
 # File lock timeout (in seconds)
 FILE_LOCK_TIMEOUT = 10.0
 
+# Maximum number of parsed workflows kept by load_workflow
+LOAD_CACHE_SIZE = 256
+
+# Number of workflow files read concurrently when listing
+LIST_READ_BATCH_SIZE = 32
+
+
+# ============================================================================
+# Summary Projection
+# ============================================================================
+
+TriggerFields = Tuple[Optional[str], Optional[str], Optional[str], Any, Optional[str]]
+
+
+def extract_trigger_fields(
+    trigger: Optional[TriggerCondition],
+    state_graph_config: Optional[Dict[str, Any]]
+) -> TriggerFields:
+    """
+    Extract (type, token, operator, value, schedule) describing a workflow trigger.
+
+    Prefers the typed WorkflowSpec trigger and falls back to the trigger
+    recorded in state_graph_config for legacy workflows.
+
+    Args:
+        trigger: Trigger from the stored WorkflowSpec, if any
+        state_graph_config: Stored state graph config
+
+    Returns:
+        Tuple of trigger fields; type is None when no trigger is recorded
+    """
+    if trigger:
+        if trigger.type == "price":
+            return trigger.type, trigger.token.value, trigger.operator, trigger.value, None
+        return trigger.type, None, None, None, trigger.schedule
+
+    if state_graph_config:
+        trigger_data = state_graph_config.get("trigger", {})
+        trigger_type = trigger_data.get("type", "manual")
+        trigger_params = trigger_data.get("params", {})
+
+        if trigger_type == "price":
+            # Handle both new format (operator/value) and legacy format (condition/threshold)
+            token = trigger_params.get("token", "?")
+            operator = trigger_params.get("operator") or trigger_params.get("condition", "?")
+            value = trigger_params.get("value") or trigger_params.get("threshold", "?")
+            return trigger_type, str(token), str(operator), str(value), None
+        if trigger_type == "time":
+            return trigger_type, None, None, None, str(trigger_params.get("schedule", "unknown schedule"))
+        return str(trigger_type), None, None, None, None
+
+    return None, None, None, None, None
+
+
+# Display names for legacy price-trigger conditions
+_OPERATOR_DISPLAY = {"less_than": "below", "greater_than": "above"}
+
+
+def summarize_trigger(
+    trigger: Optional[TriggerCondition],
+    state_graph_config: Optional[Dict[str, Any]]
+) -> Tuple[str, str]:
+    """
+    Derive (trigger_type, trigger_summary) for a workflow.
+
+    Called when a workflow is written so reads can copy the stored result.
+
+    Args:
+        trigger: Trigger from the stored WorkflowSpec, if any
+        state_graph_config: Stored state graph config
+
+    Returns:
+        Tuple of trigger type and human-readable trigger summary
+    """
+    trigger_type, token, operator, value, schedule = extract_trigger_fields(
+        trigger, state_graph_config
+    )
+    if trigger_type is None:
+        return "manual", "Manual execution"
+    if trigger_type == "price":
+        # Normalize legacy condition names for display
+        operator = _OPERATOR_DISPLAY.get(operator, operator)
+        return trigger_type, f"When {token} {operator} ${value}"
+    if trigger_type == "time":
+        return trigger_type, f"Schedule: {schedule}"
+    return trigger_type, f"{trigger_type} trigger"
+
+
+def fill_trigger_summary(stored: StoredWorkflow) -> bool:
+    """
+    Set stored.trigger_type/trigger_summary if they are missing.
+
+    Args:
+        stored: Workflow to update in place
+
+    Returns:
+        True if the fields were filled, False if already present
+    """
+    if stored.trigger_type is not None and stored.trigger_summary is not None:
+        return False
+    graph = stored.assembled_graph
+    stored.trigger_type, stored.trigger_summary = summarize_trigger(
+        graph.workflow_spec.trigger if graph.workflow_spec else None,
+        graph.state_graph_config
+    )
+    return True
+
+
+@dataclass(frozen=True)
+class WorkflowSummaryRow:
+    """Listing fields of a stored workflow, without its graph."""
+    workflow_id: str
+    workflow_name: str
+    workflow_description: str
+    status: str
+    enabled: bool
+    trigger_type: str
+    trigger_summary: str
+    execution_count: int
+    created_at: datetime
+    last_executed_at: Optional[datetime]
+
+
+class _SpecProjection(BaseModel):
+    """Only the trigger of a stored WorkflowSpec."""
+    trigger: TriggerCondition
+
+
+class _GraphProjection(BaseModel):
+    """AssembledGraph fields needed for listing; nodes and edges are skipped."""
+    workflow_name: str
+    workflow_description: str
+    workflow_spec: Optional[_SpecProjection] = None
+    state_graph_config: Dict[str, Any] = Field(default_factory=dict)
+
+
+class _FilterProjection(BaseModel):
+    """StoredWorkflow fields the list filters match on."""
+    user_id: str
+    status: Literal["active", "paused", "completed", "failed"] = "active"
+
+
+class _SummaryProjection(BaseModel):
+    """StoredWorkflow fields needed for listing."""
+    workflow_id: str
+    user_id: str
+    assembled_graph: _GraphProjection
+    status: Literal["active", "paused", "completed", "failed"] = "active"
+    enabled: bool = True
+    execution_count: int = 0
+    last_executed_at: Optional[datetime] = None
+    trigger_type: Optional[str] = None
+    trigger_summary: Optional[str] = None
+    created_at: datetime = Field(default_factory=utc_now)
+
 
 # ============================================================================
 # WorkflowStorage Service
@@ -109,9 +268,21 @@ class WorkflowStorage:
                         Defaults to data/workflows/ in project root.
         """
         self.storage_dir = storage_dir or DEFAULT_STORAGE_DIR
+        # Parsed workflows keyed by ID, tagged with the file signature they
+        # were read from so writes from any process invalidate them (LRU).
+        # Only touched on the event loop, never from worker threads.
+        self._load_cache: OrderedDict[str, Tuple[Tuple[int, int], StoredWorkflow]] = OrderedDict()
+        # Bumped on every write made through this instance; part of
+        # get_storage_signature. Event loop only, like _load_cache.
+        self._generation = 0
         self._ensure_storage_dir()
         logger.info(f"WorkflowStorage initialized with storage_dir={self.storage_dir}")
 
+    def _mark_changed(self, workflow_id: str) -> None:
+        """Drop a written workflow's cached parse and bump the storage generation."""
+        self._load_cache.pop(workflow_id, None)
+        self._generation += 1
+
     def _ensure_storage_dir(self) -> None:
         """Create storage directory if it doesn't exist."""
         try:
@@ -181,8 +352,11 @@ class WorkflowStorage:
         Raises:
             RuntimeError: If storage quotas are exceeded
         """
+        # Single directory listing shared by both quota checks
+        workflow_files = list(self.storage_dir.glob("*.json"))
+
         # Count total workflows
-        total_count = len(list(self.storage_dir.glob("*.json")))
+        total_count = len(workflow_files)
         if total_count >= MAX_TOTAL_WORKFLOWS:
             logger.error(f"Total workflow limit reached: {total_count}/{MAX_TOTAL_WORKFLOWS}")
             raise RuntimeError(
@@ -191,7 +365,7 @@ class WorkflowStorage:
 
         # Count user workflows
         user_count = 0
-        for file_path in self.storage_dir.glob("*.json"):
+        for file_path in workflow_files:
             try:
                 with open(file_path, "r", encoding="utf-8") as f:
                     data = json.load(f)
@@ -273,51 +447,96 @@ class WorkflowStorage:
                 trigger_count=0,
                 execution_count=0,
             )
+            fill_trigger_summary(stored)
 
-            # Serialize to JSON
-            json_data = stored.model_dump_json(indent=2)
+        except ValidationError as e:
+            logger.error(f"Validation error creating StoredWorkflow: {e}")
+            raise ValueError(f"Invalid workflow data: {e}") from e
 
-            # Get file paths
-            file_path = self._get_workflow_path(workflow_id)
-            temp_path = file_path.with_suffix(".tmp")
-            lock_path = self._get_lock_path(workflow_id)
+        await self.save_stored_workflow(stored)
 
-            # Use file lock to prevent race conditions (Issue #1)
-            lock = FileLock(lock_path, timeout=FILE_LOCK_TIMEOUT)
+        logger.info(f"Successfully saved workflow {workflow_id}")
+        return workflow_id
 
-            try:
-                with lock:
-                    logger.debug(f"Acquired lock for workflow {workflow_id}")
-
-                    # Write to temp file
-                    try:
-                        with open(temp_path, "w", encoding="utf-8") as f:
-                            f.write(json_data)
-
-                        # Atomic rename (overwrites existing file)
-                        temp_path.replace(file_path)
-
-                        logger.info(f"Successfully saved workflow {workflow_id}")
-                        return workflow_id
-
-                    except OSError as e:
-                        # Clean up temp file if it exists
-                        if temp_path.exists():
-                            temp_path.unlink()
-                        # Sanitized error message (Issue #7)
-                        logger.error(f"Failed to write workflow file {workflow_id}: {e}")
-                        raise RuntimeError("Failed to write workflow file") from e
-
-            except FileLockTimeout:
-                # Sanitized error message (Issue #7)
-                logger.error(f"Lock timeout for workflow {workflow_id}")
-                raise RuntimeError(
-                    f"Could not acquire file lock for workflow. Please try again."
-                ) from None
+    async def save_stored_workflow(self, stored: StoredWorkflow) -> None:
+        """
+        Write an already-built StoredWorkflow to disk under its file lock.
 
-        except ValidationError as e:
-            logger.error(f"Validation error creating StoredWorkflow: {e}")
-            raise ValueError(f"Invalid workflow data: {e}") from e
+        Same write path as save_workflow, without the quota checks, for
+        callers that assemble the StoredWorkflow themselves.
+
+        Args:
+            stored: Workflow to persist; replaces any file with the same ID
+
+        Raises:
+            ValueError: If workflow_id format is invalid
+            RuntimeError: If the lock cannot be acquired or the write fails
+        """
+        workflow_id = stored.workflow_id
+        self._validate_workflow_id(workflow_id)
+
+        # Serialize straight to JSON bytes with the model's pydantic-core
+        # serializer; same output as model_dump_json(indent=2)
+        json_data = stored.__pydantic_serializer__.to_json(stored, indent=2)
+
+        # Locked write runs in a worker thread so callers can overlap it
+        # with other work instead of blocking the event loop
+        try:
+            await asyncio.to_thread(self._write_workflow_file, workflow_id, json_data)
+        finally:
+            self._mark_changed(workflow_id)
+
+    @staticmethod
+    def _replace_workflow_file(file_path: Path, json_data: bytes) -> None:
+        """
+        Write a workflow file via a temp file and atomic rename.
+
+        Readers never see a partially written file. The caller must hold the
+        workflow's file lock. Raises OSError if the write fails, after
+        removing the temp file.
+        """
+        temp_path = file_path.with_suffix(".tmp")
+        try:
+            temp_path.write_bytes(json_data)
+            temp_path.replace(file_path)
+        except OSError:
+            if temp_path.exists():
+                temp_path.unlink()
+            raise
+
+    def _write_workflow_file(self, workflow_id: str, json_data: bytes) -> None:
+        """
+        Atomically write a serialized workflow under its file lock.
+
+        Runs in a worker thread, so it leaves _load_cache to the caller.
+
+        Raises:
+            RuntimeError: If the lock cannot be acquired or the write fails
+        """
+        # Get file paths
+        file_path = self._get_workflow_path(workflow_id)
+        lock_path = self._get_lock_path(workflow_id)
+
+        # Use file lock to prevent race conditions (Issue #1)
+        lock = FileLock(lock_path, timeout=FILE_LOCK_TIMEOUT)
+
+        try:
+            with lock:
+                logger.debug(f"Acquired lock for workflow {workflow_id}")
+
+                try:
+                    self._replace_workflow_file(file_path, json_data)
+                except OSError as e:
+                    # Sanitized error message (Issue #7)
+                    logger.error(f"Failed to write workflow file {workflow_id}: {e}")
+                    raise RuntimeError("Failed to write workflow file") from e
+
+        except FileLockTimeout:
+            # Sanitized error message (Issue #7)
+            logger.error(f"Lock timeout for workflow {workflow_id}")
+            raise RuntimeError(
+                f"Could not acquire file lock for workflow. Please try again."
+            ) from None
 
     async def update_workflow(
         self,
@@ -379,19 +598,25 @@ class WorkflowStorage:
                     else:
                         logger.warning(f"Ignoring unknown field in update: {key}")
 
+                # Keep the stored trigger summary in sync with the graph
+                if "assembled_graph" in updates:
+                    stored.trigger_type = stored.trigger_summary = None
+                    fill_trigger_summary(stored)
+
                 # Update timestamp
                 stored.updated_at = datetime.now(timezone.utc)
 
-                # Save back
-                json_data = stored.model_dump_json(indent=2)
+                # Save back via a temp file and atomic rename
+                json_data = stored.__pydantic_serializer__.to_json(stored, indent=2)
 
                 try:
-                    with open(file_path, "w", encoding="utf-8") as f:
-                        f.write(json_data)
+                    self._replace_workflow_file(file_path, json_data)
                 except OSError as e:
                     # Sanitized error message (Issue #7)
                     logger.error(f"Failed to update workflow file {workflow_id}: {e}")
                     raise RuntimeError("Failed to update workflow file") from e
+                finally:
+                    self._mark_changed(workflow_id)
 
                 logger.info(f"Successfully updated workflow {workflow_id}")
                 return stored
@@ -411,6 +636,10 @@ class WorkflowStorage:
         """
         Load a workflow from disk with validation.
 
+        Parsed workflows are cached per process and reused while the file's
+        (mtime, size) is unchanged. Each call returns a shallow copy; nested
+        models are shared with the cache and must not be mutated in place.
+
         Security Features:
             - Workflow ID validation (Issue #2)
             - Sanitized error messages (Issue #7)
@@ -437,10 +666,19 @@ class WorkflowStorage:
 
         file_path = self._get_workflow_path(workflow_id)
 
-        if not file_path.exists():
+        signature = self.get_workflow_signature(workflow_id)
+        if signature is None:
+            self._load_cache.pop(workflow_id, None)
             logger.warning(f"Workflow not found: {workflow_id}")
             raise FileNotFoundError(f"Workflow {workflow_id} does not exist")
 
+        cached = self._load_cache.get(workflow_id)
+        if cached is not None and cached[0] == signature:
+            self._load_cache.move_to_end(workflow_id)
+            # Shallow copy: callers may reassign top-level fields (see
+            # update_workflow) without touching the cached instance
+            return cached[1].model_copy()
+
         logger.debug(f"Loading workflow {workflow_id}")
 
         try:
@@ -449,9 +687,15 @@ class WorkflowStorage:
 
             # Parse and validate
             stored = StoredWorkflow.model_validate_json(json_data)
+            fill_trigger_summary(stored)
+
+            self._load_cache[workflow_id] = (signature, stored)
+            self._load_cache.move_to_end(workflow_id)
+            while len(self._load_cache) > LOAD_CACHE_SIZE:
+                self._load_cache.popitem(last=False)
 
             logger.debug(f"Successfully loaded workflow {workflow_id}")
-            return stored
+            return stored.model_copy()
 
         except json.JSONDecodeError as e:
             # Sanitized error message (Issue #7)
@@ -497,6 +741,34 @@ class WorkflowStorage:
     # List Operations
     # ========================================================================
 
+    async def _read_workflow_files(
+        self,
+        file_paths: List[Path]
+    ) -> AsyncIterator[Tuple[Path, Union[str, OSError]]]:
+        """
+        Read workflow files concurrently, yielding results in input order.
+
+        Reads run in worker threads, LIST_READ_BATCH_SIZE at a time, so a
+        listing neither blocks the event loop nor opens every file at once,
+        and callers that stop early skip the remaining batches.
+
+        Args:
+            file_paths: Workflow files to read
+
+        Yields:
+            (file_path, contents) pairs; contents is the OSError if the read failed
+        """
+        for start in range(0, len(file_paths), LIST_READ_BATCH_SIZE):
+            batch = file_paths[start:start + LIST_READ_BATCH_SIZE]
+            results = await asyncio.gather(
+                *(asyncio.to_thread(path.read_text, encoding="utf-8") for path in batch),
+                return_exceptions=True
+            )
+            for file_path, result in zip(batch, results):
+                if isinstance(result, BaseException) and not isinstance(result, OSError):
+                    raise result
+                yield file_path, result
+
     async def list_workflows(
         self,
         user_id: Optional[str] = None,
@@ -529,12 +801,13 @@ class WorkflowStorage:
         workflows = []
 
         # Iterate through all JSON files in storage directory
-        for file_path in self.storage_dir.glob("*.json"):
+        async for file_path, json_data in self._read_workflow_files(list(self.storage_dir.glob("*.json"))):
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    json_data = f.read()
+                if isinstance(json_data, OSError):
+                    raise json_data
 
                 stored = StoredWorkflow.model_validate_json(json_data)
+                fill_trigger_summary(stored)
 
                 # Apply filters
                 if user_id and stored.user_id != user_id:
@@ -556,6 +829,138 @@ class WorkflowStorage:
         logger.info(f"Found {len(workflows)} workflows")
         return workflows
 
+    async def list_workflow_summaries(
+        self,
+        user_id: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[WorkflowSummaryRow]:
+        """
+        List summary rows for workflows, optionally filtered by user or status.
+
+        Unlike list_workflows, this validates only the fields a listing needs,
+        so React Flow nodes, edges, and workflow steps are never hydrated.
+        Rows are ordered by workflow_id, and reading stops once the requested
+        page is filled.
+
+        Args:
+            user_id: Optional user ID filter
+            status: Optional status filter ("active", "paused", etc.)
+            limit: Optional maximum number of rows to return
+            offset: Number of matching rows to skip
+
+        Returns:
+            List of WorkflowSummaryRow instances
+        """
+        logger.debug(
+            f"Listing workflow summaries (user_id={user_id}, status={status}, "
+            f"limit={limit}, offset={offset})"
+        )
+
+        rows = []
+        file_paths = sorted(self.storage_dir.glob("*.json"))
+
+        if user_id or status:
+            # Matches are only known after reading, so skip them as they come
+            skip = offset
+        else:
+            # Every file matches, so slice the page before reading anything
+            file_paths = file_paths[offset:None if limit is None else offset + limit]
+            skip = 0
+
+        async for file_path, json_data in self._read_workflow_files(file_paths):
+            if limit is not None and len(rows) >= limit:
+                break
+
+            try:
+                if isinstance(json_data, OSError):
+                    raise json_data
+
+                stored = _SummaryProjection.model_validate_json(json_data)
+
+                # Apply filters
+                if user_id and stored.user_id != user_id:
+                    continue
+                if status and stored.status != status:
+                    continue
+                if skip:
+                    skip -= 1
+                    continue
+
+                graph = stored.assembled_graph
+                trigger_type, trigger_summary = stored.trigger_type, stored.trigger_summary
+                if trigger_type is None or trigger_summary is None:
+                    # Written before trigger summaries were stored
+                    trigger_type, trigger_summary = summarize_trigger(
+                        graph.workflow_spec.trigger if graph.workflow_spec else None,
+                        graph.state_graph_config
+                    )
+
+                rows.append(WorkflowSummaryRow(
+                    workflow_id=stored.workflow_id,
+                    workflow_name=graph.workflow_name,
+                    workflow_description=graph.workflow_description,
+                    status=stored.status,
+                    enabled=stored.enabled,
+                    trigger_type=trigger_type,
+                    trigger_summary=trigger_summary,
+                    execution_count=stored.execution_count,
+                    created_at=stored.created_at,
+                    last_executed_at=stored.last_executed_at,
+                ))
+
+            except (json.JSONDecodeError, ValidationError) as e:
+                # Sanitized logging - don't expose file paths (Issue #7)
+                logger.warning(f"Skipping invalid workflow file {file_path.stem}: {e}")
+                continue
+            except OSError as e:
+                # Sanitized logging - don't expose file paths (Issue #7)
+                logger.warning(f"Failed to read workflow file {file_path.stem}: {e}")
+                continue
+
+        logger.info(f"Found {len(rows)} workflows")
+        return rows
+
+    async def count_workflows(
+        self,
+        user_id: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> int:
+        """
+        Count workflows matching the list_workflow_summaries filters.
+
+        Without filters this is the number of workflow files and nothing is
+        read. With filters, each file is read but only user_id and status
+        are validated; unreadable or invalid files are not counted.
+
+        Args:
+            user_id: Optional user ID filter
+            status: Optional status filter ("active", "paused", etc.)
+
+        Returns:
+            Number of matching workflows
+        """
+        file_paths = list(self.storage_dir.glob("*.json"))
+        if not (user_id or status):
+            return len(file_paths)
+
+        count = 0
+        async for file_path, json_data in self._read_workflow_files(file_paths):
+            if isinstance(json_data, OSError):
+                continue
+            try:
+                stored = _FilterProjection.model_validate_json(json_data)
+            except ValidationError:
+                continue
+            if user_id and stored.user_id != user_id:
+                continue
+            if status and stored.status != status:
+                continue
+            count += 1
+
+        return count
+
     async def list_workflow_ids(self) -> List[str]:
         """
         List all workflow IDs (lightweight operation).
@@ -575,6 +980,52 @@ class WorkflowStorage:
         ]
         return workflow_ids
 
+    # ========================================================================
+    # Change Detection
+    # ========================================================================
+
+    def get_workflow_signature(self, workflow_id: str) -> Optional[Tuple[int, int]]:
+        """
+        Get a cheap change marker for one workflow file.
+
+        Uses a single stat() call, so callers can tell whether a workflow
+        changed without reading and validating it. Reflects writes from any
+        process, not only this instance.
+
+        Args:
+            workflow_id: Workflow identifier
+
+        Returns:
+            (mtime_ns, size) of the workflow file, or None if it doesn't exist
+
+        Raises:
+            ValueError: If workflow_id format is invalid
+        """
+        try:
+            st = self._get_workflow_path(workflow_id).stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def get_storage_signature(self) -> Tuple[int, int]:
+        """
+        Get a cheap change marker for the whole storage directory.
+
+        Changes whenever a workflow is created, updated, or deleted. Writes
+        through this instance bump a generation counter; writes from other
+        processes are seen through the directory's mtime, which every create,
+        atomic replace and delete updates. Costs a single stat() regardless
+        of how many workflows are stored.
+
+        Returns:
+            (generation, directory mtime_ns)
+        """
+        try:
+            mtime_ns = self.storage_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = 0
+        return (self._generation, mtime_ns)
+
     # ========================================================================
     # Delete Operations
     # ========================================================================
@@ -623,6 +1074,7 @@ class WorkflowStorage:
 
                 try:
                     file_path.unlink()
+                    self._mark_changed(workflow_id)
                     logger.info(f"Successfully deleted workflow {workflow_id}")
 
                     # Clean up lock file
@@ -645,6 +1097,48 @@ class WorkflowStorage:
     # Utility Operations
     # ========================================================================
 
+    async def backfill_trigger_summaries(self) -> int:
+        """
+        Persist trigger_type/trigger_summary for workflows written without them.
+
+        One-time migration for files saved before these fields existed.
+        Leaves updated_at untouched.
+
+        Returns:
+            Number of workflow files rewritten
+        """
+        migrated = 0
+
+        for workflow_id in await self.list_workflow_ids():
+            try:
+                file_path = self._get_workflow_path(workflow_id)
+            except ValueError:
+                continue
+
+            lock = FileLock(self._get_lock_path(workflow_id), timeout=FILE_LOCK_TIMEOUT)
+            try:
+                with lock:
+                    with open(file_path, "r", encoding="utf-8") as f:
+                        stored = StoredWorkflow.model_validate_json(f.read())
+
+                    if not fill_trigger_summary(stored):
+                        continue
+
+                    self._replace_workflow_file(
+                        file_path,
+                        stored.__pydantic_serializer__.to_json(stored, indent=2)
+                    )
+                    self._mark_changed(workflow_id)
+                    migrated += 1
+
+            except (ValidationError, OSError, FileLockTimeout) as e:
+                # Sanitized logging - don't expose file paths (Issue #7)
+                logger.warning(f"Skipping workflow {workflow_id} during backfill: {e}")
+                continue
+
+        logger.info(f"Backfilled trigger summaries for {migrated} workflows")
+        return migrated
+
     async def get_storage_stats(self) -> Dict[str, Any]:
         """
         Get storage statistics.
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Backfill Stored Trigger Summaries
+
+Workflows saved before trigger_type/trigger_summary were persisted have
+them derived on every read. This one-time migration writes them into the
+stored workflow files.
+
+Usage:
+    python migrate_trigger_summaries.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add app to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.services.workflow_storage import get_workflow_storage
+
+
+async def migrate():
+    """Backfill trigger summaries for all stored workflows."""
+    storage = get_workflow_storage()
+    migrated = await storage.backfill_trigger_summaries()
+    print(f"Backfilled trigger summaries for {migrated} workflow(s)")
+
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
@@ -0,0 +1,176 @@
+"""
+Tests for the graph generation endpoint (POST /api/v1/generate).
+
+Tests cover:
+- Success response shape and timestamp format
+- Storage failures surfacing as INTERNAL_ERROR
+- Serialization failures not masked by a failing save
+- user_id character set
+"""
+
+import re
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from app.main import app
+from app.api.v1.workflow import GenerateRequest
+from app.models.workflow_models import (
+    WorkflowSpec,
+    WorkflowStep,
+    PriceCondition,
+    SwapAction,
+    TokenType,
+)
+from app.models.graph_models import (
+    AssembledGraph,
+    ReactFlowGraph,
+    GraphNode,
+    NodePosition,
+)
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+def client():
+    """Create a FastAPI TestClient with a fresh rate-limit bucket"""
+    from app.api.v1.workflow import _rate_limit_store
+    _rate_limit_store.clear()
+    yield TestClient(app, raise_server_exceptions=False)
+    _rate_limit_store.clear()
+
+
+@pytest.fixture
+def sample_workflow_spec():
+    """Sample workflow specification for testing"""
+    return WorkflowSpec(
+        name="Auto DCA into NEO",
+        description="When GAS price falls below $5, automatically swap 10 GAS for NEO",
+        trigger=PriceCondition(type="price", token=TokenType.GAS, operator="below", value=5.0),
+        steps=[
+            WorkflowStep(
+                action=SwapAction(type="swap", from_token=TokenType.GAS, to_token=TokenType.NEO, amount=10.0),
+                description="Swap 10 GAS to NEO"
+            )
+        ]
+    )
+
+
+@pytest.fixture
+def sample_assembled_graph(sample_workflow_spec):
+    """Sample assembled graph for testing"""
+    return AssembledGraph(
+        workflow_id="wf_test123456",
+        workflow_name="Auto DCA into NEO",
+        workflow_description="When GAS price falls below $5, automatically swap 10 GAS for NEO",
+        workflow_spec=sample_workflow_spec,
+        react_flow=ReactFlowGraph(
+            nodes=[
+                GraphNode(
+                    id="trigger_1",
+                    type="trigger",
+                    label="GAS Below $5.00",
+                    position=NodePosition(x=250, y=0),
+                    parameters={"token": "GAS", "operator": "below", "value": 5.0},
+                    data={"label": "GAS Below $5.00", "type": "price", "icon": "dollar-sign"}
+                )
+            ],
+            edges=[]
+        ),
+        state_graph_config={"nodes": [], "edges": []}
+    )
+
+
+@pytest.fixture
+def mock_pipeline(sample_assembled_graph):
+    """Patch node design, assembly and storage; yields the storage mock"""
+    assembler = MagicMock()
+    assembler.assemble = AsyncMock(return_value=sample_assembled_graph)
+    storage = MagicMock()
+    storage.save_workflow = AsyncMock(return_value=sample_assembled_graph.workflow_id)
+
+    with patch("app.api.v1.workflow.design_workflow_nodes_cached", AsyncMock(return_value=[])), \
+            patch("app.api.v1.workflow.get_graph_assembler", AsyncMock(return_value=assembler)), \
+            patch("app.api.v1.workflow.get_workflow_storage", return_value=storage):
+        yield storage
+
+
+def generate(client, workflow_spec):
+    return client.post(
+        "/api/v1/generate",
+        json={"workflow_spec": workflow_spec.model_dump(mode="json"), "user_id": "test_user"}
+    )
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+def test_generate_success(client, mock_pipeline, sample_workflow_spec):
+    """Test a successful generate returns the stored ID and graph"""
+    response = generate(client, sample_workflow_spec)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["success"] is True
+    assert data["workflow_id"] == "wf_test123456"
+    assert [node["id"] for node in data["nodes"]] == ["trigger_1"]
+    assert data["edges"] == []
+    mock_pipeline.save_workflow.assert_awaited_once()
+
+
+def test_generate_timestamp_uses_z_suffix(client, mock_pipeline, sample_workflow_spec):
+    """Test the success timestamp keeps the UTC "Z" form of the response model"""
+    data = generate(client, sample_workflow_spec).json()
+
+    assert re.fullmatch(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d(\.\d+)?Z", data["timestamp"])
+
+
+def test_generate_storage_failure_returns_internal_error(client, mock_pipeline, sample_workflow_spec):
+    """Test a failing save is reported instead of a success body"""
+    mock_pipeline.save_workflow.side_effect = RuntimeError("Failed to write workflow file")
+
+    response = generate(client, sample_workflow_spec)
+
+    assert response.status_code == 500
+    assert response.json()["detail"]["error"]["code"] == "INTERNAL_ERROR"
+
+
+def test_generate_serialization_error_not_masked_by_save(client, mock_pipeline, sample_workflow_spec):
+    """Test a serialization error wins over a save that also failed"""
+    mock_pipeline.save_workflow.side_effect = RuntimeError("Failed to write workflow file")
+
+    with patch("app.api.v1.workflow._GRAPH_NODES_ADAPTER") as nodes_adapter:
+        nodes_adapter.dump_json.side_effect = ValueError("bad node")
+        response = generate(client, sample_workflow_spec)
+
+    assert response.status_code == 422
+    error = response.json()["detail"]["error"]
+    assert error["code"] == "VALIDATION_ERROR"
+    assert error["details"] == "bad node"
+    mock_pipeline.save_workflow.assert_awaited_once()
+
+
+@pytest.mark.parametrize("user_id", [
+    "user_1", "jane.doe-2", "José", "Zoë_Müller", "用户", "пользователь", "٣٤", "A.B-C_D",
+])
+def test_generate_request_accepts_unicode_alphanumeric_user_id(sample_workflow_spec, user_id):
+    """Test user_id accepts letters/digits in any script plus _ . -"""
+    request = GenerateRequest(workflow_spec=sample_workflow_spec, user_id=user_id)
+    assert request.user_id == user_id
+
+
+@pytest.mark.parametrize("user_id", [
+    "user id", "user;drop", "<script>", "a/b", "user@example", "name\u00a0x", "emoji😀", "a+b",
+])
+def test_generate_request_rejects_other_user_id_characters(sample_workflow_spec, user_id):
+    """Test user_id rejects anything str.isalnum() and _ . - would not allow"""
+    assert not all(c.isalnum() or c in "_.-" for c in user_id)
+    with pytest.raises(ValidationError):
+        GenerateRequest(workflow_spec=sample_workflow_spec, user_id=user_id)
+
@@ -2,7 +2,13 @@
 Tests for main FastAPI application
 """
 
+import asyncio
+import gzip
+from unittest.mock import patch
+
+import httpx
 import pytest
+from fastapi import FastAPI, Request, Response
 from fastapi.testclient import TestClient
 from app.main import app
 
@@ -32,3 +38,130 @@ def test_health_endpoint(client):
     # Legacy endpoint just returns status, message, and timestamp
     assert "message" in data
     assert "timestamp" in data
+
+
+def test_health_endpoint_returns_etag_and_304(client):
+    """Test liveness responses carry an ETag and honour If-None-Match"""
+    response = client.get("/health")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    cached = client.get("/health", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+
+def test_health_endpoint_replays_cached_body(client):
+    """Test repeated liveness GETs within the cache window get the same body"""
+    from app.middleware import cache_middleware
+
+    cache_middleware._micro_cache.clear()
+    first = client.get("/")
+    second = client.get("/")
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert second.headers["content-type"] == "application/json"
+
+
+def test_micro_cache_keys_on_accept_encoding():
+    """Test a gzip body is never replayed to a client that did not ask for it"""
+    from app.middleware import cache_middleware
+
+    encoding_app = FastAPI()
+
+    @encoding_app.get("/health")
+    async def encoded_health(request: Request):
+        body = b'{"status":"healthy"}'
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            return Response(gzip.compress(body), media_type="application/json",
+                            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"})
+        return Response(body, media_type="application/json", headers={"Vary": "Accept-Encoding"})
+
+    encoding_app.middleware("http")(cache_middleware.micro_cache_middleware)
+    cache_middleware._micro_cache.clear()
+    encoding_client = TestClient(encoding_app)
+
+    for _ in range(2):
+        gzipped = encoding_client.get("/health", headers={"Accept-Encoding": "gzip"})
+        plain = encoding_client.get("/health", headers={"Accept-Encoding": "identity"})
+
+        assert gzipped.headers["content-encoding"] == "gzip"
+        assert gzipped.headers["vary"] == "Accept-Encoding"
+        assert gzipped.json() == {"status": "healthy"}
+        assert "content-encoding" not in plain.headers
+        assert plain.content == b'{"status":"healthy"}'
+        assert plain.headers["vary"] == "Accept-Encoding"
+
+    assert len(cache_middleware._micro_cache) == 2
+    cache_middleware._micro_cache.clear()
+
+
+def test_micro_cache_size_bounded_by_accept_encoding_variants(client):
+    """Test arbitrary Accept-Encoding values cannot grow the micro-cache"""
+    from app.middleware import cache_middleware
+
+    cache_middleware._micro_cache.clear()
+    for i in range(50):
+        client.get("/health", headers={"Accept-Encoding": f"gzip;q=0.{i}, x-{i}"})
+        client.get("/health", headers={"Accept-Encoding": f"x-custom-{i}"})
+
+    assert set(cache_middleware._micro_cache) == {("/health", "gzip"), ("/health", "identity")}
+    cache_middleware._micro_cache.clear()
+
+
+async def test_concurrent_detailed_health_checks_are_coalesced():
+    """Test concurrent /api/v1/health requests share one dependency check"""
+    from app.api.v1 import health
+
+    calls = 0
+
+    async def slow_check():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return health.ServiceStatus(status=health.ServiceStatusValue.OK, message="ok")
+
+    transport = httpx.ASGITransport(app=app)
+    with patch.object(health, "check_neo_rpc", slow_check):
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            responses = await asyncio.gather(*(ac.get("/api/v1/health") for _ in range(5)))
+
+    assert calls == 1
+    assert all(r.status_code == responses[0].status_code for r in responses)
+    assert len({r.content for r in responses}) == 1
+
+
+async def test_single_flight_keys_on_accept_encoding():
+    """Test coalesced health checks only share responses with the same Accept-Encoding"""
+    from app.middleware import cache_middleware
+
+    calls = 0
+    encoding_app = FastAPI()
+
+    @encoding_app.get("/api/v1/health")
+    async def encoded_health(request: Request):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        body = b'{"status":"healthy"}'
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            return Response(gzip.compress(body), media_type="application/json",
+                            headers={"Content-Encoding": "gzip"})
+        return Response(body, media_type="application/json")
+
+    encoding_app.middleware("http")(cache_middleware.single_flight_middleware)
+    transport = httpx.ASGITransport(app=encoding_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        responses = await asyncio.gather(*(
+            ac.get("/api/v1/health", headers={"Accept-Encoding": encoding})
+            for encoding in ("gzip", "identity", "gzip", "identity")
+        ))
+
+    assert calls == 2
+    for response in responses[0::2]:
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json() == {"status": "healthy"}
+    for response in responses[1::2]:
+        assert "content-encoding" not in response.headers
+        assert response.content == b'{"status":"healthy"}'
@@ -25,6 +25,17 @@ from app.models.workflow_models import (
 client = TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def reset_rate_limit():
+    """Start each test with a fresh rate-limit budget.
+
+    The limiter runs as middleware, so every request to /parse counts,
+    including ones later rejected by body validation.
+    """
+    from app.api.v1.workflow import _rate_limit_store
+    _rate_limit_store.clear()
+
+
 # ============================================================================
 # Test Fixtures
 # ============================================================================
@@ -111,6 +122,72 @@ def test_parse_endpoint_success(mock_parser_success):
         assert workflow["steps"][0]["action"]["type"] == "swap"
 
 
+def test_parse_workflow_spec_token_round_trip(mock_parser_success):
+    """Test that a spec echoed back with its token skips re-validation"""
+    from app.api.v1.workflow import GenerateRequest
+
+    with patch('app.api.v1.workflow.get_parser') as mock_get_parser:
+        mock_parser = AsyncMock()
+        mock_parser.parse_workflow = AsyncMock(return_value=mock_parser_success)
+        mock_get_parser.return_value = mock_parser
+
+        response = client.post(
+            "/api/v1/parse",
+            json={"input": "When GAS drops below $5, swap 10 GAS for NEO"}
+        )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["workflow_spec_token"]
+
+    # Unchanged spec + token is rebuilt without validation
+    request = GenerateRequest.model_validate({
+        "workflow_spec": data["workflow_spec"],
+        "workflow_spec_token": data["workflow_spec_token"],
+    })
+    assert request.workflow_spec == mock_parser_success.workflow
+    assert request.workflow_spec.trigger.token is TokenType.GAS
+
+    # Numbers re-encoded without ".0" (as JSON.stringify does) still match
+    js_spec = {**data["workflow_spec"], "trigger": {**data["workflow_spec"]["trigger"], "value": 5}}
+    request = GenerateRequest.model_validate({
+        "workflow_spec": js_spec,
+        "workflow_spec_token": data["workflow_spec_token"],
+    })
+    assert request.workflow_spec.trigger.value == 5.0
+    assert isinstance(request.workflow_spec.trigger.value, float)
+
+    # Modified spec falls back to full validation (which strips the name)
+    edited = {**data["workflow_spec"], "name": "  Edited workflow  "}
+    request = GenerateRequest.model_validate({
+        "workflow_spec": edited,
+        "workflow_spec_token": data["workflow_spec_token"],
+    })
+    assert request.workflow_spec.name == "Edited workflow"
+
+
+def test_workflow_spec_token_skips_validation_only_when_signed(mock_parser_success):
+    """Test a valid token bypasses validators and a forged one does not"""
+    from app.api.v1.workflow import GenerateRequest, issue_workflow_spec_token
+
+    # Validation would strip this name; only a signed payload keeps it as is
+    spec = mock_parser_success.workflow.model_copy(update={"name": "  Padded  "})
+    payload = spec.model_dump(mode="json")
+
+    signed = GenerateRequest.model_validate({
+        "workflow_spec": payload,
+        "workflow_spec_token": issue_workflow_spec_token(spec),
+    })
+    assert signed.workflow_spec.name == "  Padded  "
+
+    for token in ("0" * 64, "\u00e9" * 64, None):
+        forged = GenerateRequest.model_validate({
+            "workflow_spec": payload,
+            "workflow_spec_token": token,
+        })
+        assert forged.workflow_spec.name == "Padded"
+
+
 def test_parse_endpoint_time_trigger(mock_parser_success):
     """Test parsing with time-based trigger"""
     # Create time-based workflow
@@ -542,6 +619,36 @@ def test_parse_endpoint_rate_limiting():
         assert "10 requests per 60 seconds" in detail["error"]["details"]
 
 
+def test_rate_limited_response_has_cors_headers():
+    """429s from the rate-limit middleware must be readable by the frontend"""
+    import time
+    from app.api.v1.workflow import _rate_limit_store
+    _rate_limit_store["testclient"] = (0.0, time.monotonic())
+
+    response = client.post(
+        "/api/v1/parse",
+        json={"input": "Swap 10 GAS for NEO"},
+        headers={"Origin": "http://localhost:5173"}
+    )
+
+    assert response.status_code == 429
+    assert response.headers["access-control-allow-origin"] == "http://localhost:5173"
+
+
+def test_oversized_request_has_cors_headers():
+    """413s from the rate-limit middleware must be readable by the frontend"""
+    from app.api.v1.workflow import MAX_REQUEST_BODY_BYTES
+
+    response = client.post(
+        "/api/v1/parse",
+        content=b"x" * (MAX_REQUEST_BODY_BYTES + 1),
+        headers={"Origin": "http://localhost:5173", "Content-Type": "application/json"}
+    )
+
+    assert response.status_code == 413
+    assert response.headers["access-control-allow-origin"] == "http://localhost:5173"
+
+
 # ============================================================================
 # Test Edge Cases
 # ============================================================================
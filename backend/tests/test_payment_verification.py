@@ -63,7 +63,7 @@ class TestPaymentHeaderDecoding:
         assert decoded.x402Version == 1
         assert decoded.scheme == "exact"
         assert decoded.network == "base-sepolia"
-        assert decoded.payload["signature"] == "0xabcd1234"
+        assert decoded.payload.signature == "0xabcd1234"
 
     def test_decode_invalid_base64(self):
         """Should return None for invalid base64"""
@@ -187,6 +187,51 @@ class TestPaymentStructureVerification:
         assert result.is_valid is False
         assert result.error_code == PaymentErrorCode.PAYMENT_MISSING_AUTHORIZATION
 
+    def test_reject_empty_payload(self):
+        """Should reject an empty payload object as missing"""
+        service = PaymentService()
+
+        payload = PaymentPayload(
+            x402Version=1,
+            scheme="exact",
+            network="base-sepolia",
+            payload={}
+        )
+
+        result = service._verify_payment_structure(payload)
+        assert result.is_valid is False
+        assert result.error_code == PaymentErrorCode.PAYMENT_MISSING_PAYLOAD
+
+    def test_payload_with_only_unknown_keys_reports_missing_authorization(self):
+        """Should treat a payload with only unknown keys as present but unauthorized"""
+        service = PaymentService()
+
+        payload = PaymentPayload(
+            x402Version=1,
+            scheme="exact",
+            network="base-sepolia",
+            payload={"unexpected": "value"}
+        )
+
+        result = service._verify_payment_structure(payload)
+        assert result.is_valid is False
+        assert result.error_code == PaymentErrorCode.PAYMENT_MISSING_AUTHORIZATION
+
+    def test_authorization_with_only_unknown_keys_counts_as_present(self):
+        """Should move on to the signature check when authorization has only unknown keys"""
+        service = PaymentService()
+
+        payload = PaymentPayload(
+            x402Version=1,
+            scheme="exact",
+            network="base-sepolia",
+            payload={"authorization": {"unexpected": "value"}}
+        )
+
+        result = service._verify_payment_structure(payload)
+        assert result.is_valid is False
+        assert result.error_code == PaymentErrorCode.PAYMENT_MISSING_SIGNATURE
+
 
 class TestPaymentExpiryVerification:
     """Test payment expiry validation"""
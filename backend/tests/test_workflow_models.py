@@ -21,6 +21,7 @@ from app.models.workflow_models import (
     StakeAction,
     TransferAction,
     EXAMPLE_WORKFLOWS,
+    construct_workflow_spec,
 )
 
 
@@ -222,6 +223,27 @@ def test_swap_action_neither_amount_nor_percentage_invalid():
         )
 
 
+def test_amount_or_percentage_subclass_must_declare_both_fields():
+    """Test an action missing amount/percentage fails at class definition"""
+    from typing import Optional
+    from pydantic import Field
+    from app.models.workflow_models import _AmountOrPercentage
+
+    with pytest.raises(TypeError, match="percentage"):
+        class AmountOnlyAction(_AmountOrPercentage):
+            amount: Optional[float] = Field(None, gt=0)
+
+
+def test_action_amount_errors_are_validation_errors():
+    """Test amount/percentage errors surface as ValidationError (a ValueError)"""
+    with pytest.raises(ValidationError, match="Must specify either amount or percentage") as exc_info:
+        StakeAction(type="stake", token=TokenType.NEO)
+    assert isinstance(exc_info.value, ValueError)
+
+    with pytest.raises(ValidationError, match="Cannot specify both amount and percentage"):
+        StakeAction(type="stake", token=TokenType.NEO, amount=1.0, percentage=50.0)
+
+
 def test_stake_action_valid():
     """
     Test creating a valid staking action with fixed amount.
@@ -625,3 +647,34 @@ def test_workflow_spec_json_round_trip():
     assert spec_restored.name == spec.name
     assert spec_restored.trigger.value == spec.trigger.value
     assert spec_restored.steps[0].action.amount == spec.steps[0].action.amount
+
+
+def test_construct_workflow_spec_matches_validated_spec():
+    """Test construct_workflow_spec rebuilds nested models and enums from a JSON dump"""
+    specs = list(EXAMPLE_WORKFLOWS.values()) + [
+        WorkflowSpec(
+            name="Transfer",
+            description="Send NEO when GAS rises",
+            trigger=PriceCondition(type="price", token=TokenType.GAS, operator="above", value=10.0),
+            steps=[
+                WorkflowStep(
+                    action=TransferAction(
+                        type="transfer",
+                        token=TokenType.NEO,
+                        to_address="NNLi44dJNXtDNSBkofB48aTVYtb1zZrNEs",
+                        amount=1.0
+                    )
+                )
+            ]
+        )
+    ]
+
+    for spec in specs:
+        constructed = construct_workflow_spec(spec.model_dump(mode="json"))
+
+        assert constructed == spec
+        assert type(constructed.trigger) is type(spec.trigger)
+        for step, original in zip(constructed.steps, spec.steps):
+            assert type(step) is WorkflowStep
+            assert type(step.action) is type(original.action)
+        assert constructed.model_dump(mode="json") == spec.model_dump(mode="json")
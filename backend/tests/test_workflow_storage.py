@@ -0,0 +1,344 @@
+"""
+Tests for WorkflowStorage and the workflow listing endpoint.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime, UTC
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.workflow_storage import WorkflowStorage
+
+client = TestClient(app)
+
+SAMPLE_WORKFLOW = Path(__file__).parent.parent / "data" / "workflows" / "wf_buy_the_dip.json"
+
+
+def write_workflow(storage_dir: Path, workflow_id: str, user_id: str = "user_a", status: str = "active") -> None:
+    """Write a copy of the sample workflow under a new ID, owner and status."""
+    data = json.loads(SAMPLE_WORKFLOW.read_text(encoding="utf-8"))
+    data["workflow_id"] = workflow_id
+    data["user_id"] = user_id
+    data["status"] = status
+    data["assembled_graph"]["workflow_id"] = workflow_id
+    (storage_dir / f"{workflow_id}.json").write_text(json.dumps(data), encoding="utf-8")
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """Empty storage in a temp directory, used by the workflow routes."""
+    from app.api.v1.workflow import _workflow_response_cache
+    _workflow_response_cache.clear()
+
+    storage = WorkflowStorage(storage_dir=tmp_path)
+    with patch("app.api.v1.workflow.get_workflow_storage", return_value=storage):
+        yield storage
+    _workflow_response_cache.clear()
+
+
+# ============================================================================
+# Listing and pagination
+# ============================================================================
+
+class TestListWorkflows:
+    """GET /api/v1/workflows paging"""
+
+    def test_single_page(self, storage):
+        for i in range(3):
+            write_workflow(storage.storage_dir, f"wf_{i:012d}")
+
+        data = client.get("/api/v1/workflows").json()
+
+        assert [w["workflow_id"] for w in data["workflows"]] == [f"wf_{i:012d}" for i in range(3)]
+        assert data["total"] == 3
+        assert data["has_more"] is False
+
+    def test_limit_and_offset(self, storage):
+        for i in range(5):
+            write_workflow(storage.storage_dir, f"wf_{i:012d}")
+
+        first = client.get("/api/v1/workflows", params={"limit": 2}).json()
+        middle = client.get("/api/v1/workflows", params={"limit": 2, "offset": 2}).json()
+        last = client.get("/api/v1/workflows", params={"limit": 2, "offset": 4}).json()
+
+        assert [w["workflow_id"] for w in first["workflows"]] == ["wf_000000000000", "wf_000000000001"]
+        assert [w["workflow_id"] for w in middle["workflows"]] == ["wf_000000000002", "wf_000000000003"]
+        assert [w["workflow_id"] for w in last["workflows"]] == ["wf_000000000004"]
+        assert (first["has_more"], middle["has_more"], last["has_more"]) == (True, True, False)
+        assert first["total"] == middle["total"] == last["total"] == 5
+        assert (middle["limit"], middle["offset"]) == (2, 2)
+
+    def test_total_counts_filtered_matches(self, storage):
+        for i in range(4):
+            write_workflow(storage.storage_dir, f"wf_{i:012d}", status="active" if i % 2 else "paused")
+        write_workflow(storage.storage_dir, "wf_other_user0", user_id="user_b")
+
+        data = client.get(
+            "/api/v1/workflows",
+            params={"workflow_status": "active", "user_id": "user_a", "limit": 1}
+        ).json()
+
+        assert [w["workflow_id"] for w in data["workflows"]] == ["wf_000000000001"]
+        assert data["total"] == 2
+        assert data["has_more"] is True
+
+    def test_offset_past_end(self, storage):
+        write_workflow(storage.storage_dir, "wf_000000000000")
+
+        data = client.get("/api/v1/workflows", params={"offset": 5}).json()
+
+        assert data["workflows"] == []
+        assert data["total"] == 1
+        assert data["has_more"] is False
+
+    def test_limit_bounds(self, storage):
+        assert client.get("/api/v1/workflows", params={"limit": 0}).status_code == 422
+        assert client.get("/api/v1/workflows", params={"limit": 201}).status_code == 422
+        assert client.get("/api/v1/workflows", params={"offset": -1}).status_code == 422
+
+
+class TestResponseCache:
+    """Cached GET /workflows and /workflows/{id} bodies"""
+
+    @pytest.mark.parametrize("path", ["/api/v1/workflows", "/api/v1/workflows/wf_000000000000"])
+    def test_cache_hit_gets_current_timestamp(self, storage, path):
+        write_workflow(storage.storage_dir, "wf_000000000000")
+        first_time = datetime(2026, 1, 1, 9, 0, tzinfo=UTC)
+        later_time = datetime(2026, 1, 1, 12, 30, 15, 250000, tzinfo=UTC)
+
+        with patch("app.api.v1.workflow.utc_now", return_value=first_time):
+            first = client.get(path).json()
+        with patch("app.api.v1.workflow.utc_now", return_value=later_time):
+            second = client.get(path).json()
+
+        assert first["timestamp"] == "2026-01-01T09:00:00Z"
+        assert second["timestamp"] == "2026-01-01T12:30:15.250000Z"
+        assert {**first, "timestamp": None} == {**second, "timestamp": None}
+
+    def test_list_sees_new_workflow(self, storage):
+        write_workflow(storage.storage_dir, "wf_000000000000")
+        # Backdate the directory so the next write lands on a later mtime
+        os.utime(storage.storage_dir, ns=(0, 0))
+        assert client.get("/api/v1/workflows").json()["total"] == 1
+
+        write_workflow(storage.storage_dir, "wf_000000000001")
+        assert client.get("/api/v1/workflows").json()["total"] == 2
+
+
+class TestUpdateAndDeleteResponses:
+    """PATCH and DELETE /api/v1/workflows/{id} bodies"""
+
+    def test_timestamps_use_z_suffix(self, storage):
+        write_workflow(storage.storage_dir, "wf_000000000000")
+        now = datetime(2026, 1, 1, 9, 0, 0, 500000, tzinfo=UTC)
+
+        with patch("app.api.v1.workflow.utc_now", return_value=now):
+            updated = client.patch("/api/v1/workflows/wf_000000000000", json={"status": "paused"})
+            deleted = client.delete("/api/v1/workflows/wf_000000000000")
+
+        assert updated.status_code == 200
+        assert updated.json()["timestamp"] == "2026-01-01T09:00:00.500000Z"
+        assert deleted.status_code == 200
+        assert deleted.json()["timestamp"] == "2026-01-01T09:00:00.500000Z"
+
+
+class TestExecutionsResponse:
+    """GET /api/v1/workflows/{id}/executions timestamps"""
+
+    def test_timestamps_match_isoformat(self):
+        from unittest.mock import AsyncMock
+        from app.services.execution_storage import ExecutionRecord
+
+        records = [
+            ExecutionRecord(
+                execution_id="exec_1", workflow_id="wf_000000000000", workflow_name="Test",
+                user_address="N/A", trigger_type="time", status="completed",
+                started_at=datetime(2026, 1, 1, 9, 0, tzinfo=UTC),
+                completed_at=datetime(2026, 1, 1, 9, 0, 1, 250000, tzinfo=UTC),
+            ),
+            ExecutionRecord(
+                execution_id="exec_2", workflow_id="wf_000000000000", workflow_name="Test",
+                user_address="N/A", trigger_type="time",
+                started_at=datetime(2026, 1, 1, 10, 0),
+            ),
+        ]
+        execution_storage = AsyncMock()
+        execution_storage.get_workflow_executions.return_value = records
+
+        with patch("app.api.v1.workflow.get_execution_storage", AsyncMock(return_value=execution_storage)):
+            data = client.get("/api/v1/workflows/wf_000000000000/executions").json()
+
+        # Same strings the endpoint built with isoformat() before it switched to orjson
+        assert [(e["started_at"], e["completed_at"]) for e in data] == [
+            ("2026-01-01T09:00:00+00:00", "2026-01-01T09:00:01.250000+00:00"),
+            ("2026-01-01T10:00:00", None),
+        ]
+
+
+class TestStorageSignature:
+    """WorkflowStorage.get_storage_signature"""
+
+    async def test_changes_on_writes(self, tmp_path):
+        storage = WorkflowStorage(storage_dir=tmp_path)
+        write_workflow(tmp_path, "wf_000000000000")
+        signatures = [storage.get_storage_signature()]
+        assert storage.get_storage_signature() == signatures[0]
+
+        await storage.update_workflow("wf_000000000000", {"status": "paused"})
+        signatures.append(storage.get_storage_signature())
+        stored = await storage.load_workflow("wf_000000000000")
+        await storage.save_workflow(stored.assembled_graph, stored.assembled_graph.workflow_spec, user_id="user_a")
+        signatures.append(storage.get_storage_signature())
+        await storage.delete_workflow("wf_000000000000")
+        signatures.append(storage.get_storage_signature())
+
+        assert len(set(signatures)) == len(signatures)
+
+    def test_sees_files_written_by_other_processes(self, tmp_path):
+        storage = WorkflowStorage(storage_dir=tmp_path)
+        os.utime(tmp_path, ns=(0, 0))
+        before = storage.get_storage_signature()
+
+        # Another process writing the directory doesn't touch this instance
+        write_workflow(tmp_path, "wf_000000000000")
+
+        assert storage.get_storage_signature() != before
+
+
+class TestCountWorkflows:
+    """WorkflowStorage.count_workflows"""
+
+    async def test_counts_files_and_filters(self, tmp_path):
+        storage = WorkflowStorage(storage_dir=tmp_path)
+        write_workflow(tmp_path, "wf_000000000000")
+        write_workflow(tmp_path, "wf_000000000001", status="paused")
+        write_workflow(tmp_path, "wf_000000000002", user_id="user_b")
+        (tmp_path / "wf_broken00000.json").write_text("{not json", encoding="utf-8")
+
+        assert await storage.count_workflows() == 4
+        assert await storage.count_workflows(user_id="user_a") == 2
+        assert await storage.count_workflows(status="active") == 2
+        assert await storage.count_workflows(user_id="user_a", status="paused") == 1
+
+
+class TestLoadCache:
+    """Writes drop the cached parse of a workflow"""
+
+    async def test_update_invalidates_cached_load(self, tmp_path):
+        storage = WorkflowStorage(storage_dir=tmp_path)
+        write_workflow(tmp_path, "wf_000000000000")
+
+        assert (await storage.load_workflow("wf_000000000000")).status == "active"
+        assert "wf_000000000000" in storage._load_cache
+
+        await storage.update_workflow("wf_000000000000", {"status": "paused"})
+
+        assert "wf_000000000000" not in storage._load_cache
+        assert (await storage.load_workflow("wf_000000000000")).status == "paused"
+
+    async def test_delete_invalidates_cached_load(self, tmp_path):
+        storage = WorkflowStorage(storage_dir=tmp_path)
+        write_workflow(tmp_path, "wf_000000000000")
+        await storage.load_workflow("wf_000000000000")
+
+        await storage.delete_workflow("wf_000000000000")
+
+        assert "wf_000000000000" not in storage._load_cache
+        with pytest.raises(FileNotFoundError):
+            await storage.load_workflow("wf_000000000000")
+
+    async def test_save_clears_cache_entry_on_event_loop(self, tmp_path):
+        storage = WorkflowStorage(storage_dir=tmp_path)
+        write_workflow(tmp_path, "wf_000000000000")
+        stored = await storage.load_workflow("wf_000000000000")
+        popped_in = []
+
+        class RecordingCache(type(storage._load_cache)):
+            def pop(self, *args):
+                popped_in.append(threading.current_thread() is threading.main_thread())
+                return super().pop(*args)
+
+        storage._load_cache = RecordingCache(storage._load_cache)
+        graph = stored.assembled_graph
+        await storage.save_workflow(graph, graph.workflow_spec, user_id="user_a")
+
+        assert "wf_000000000000" not in storage._load_cache
+        assert popped_in and all(popped_in)
+
+
+class TestBackfillTriggerSummaries:
+    """WorkflowStorage.backfill_trigger_summaries"""
+
+    @staticmethod
+    def write_legacy_workflow(storage_dir: Path, workflow_id: str) -> Path:
+        """Write a workflow file from before trigger summaries were stored."""
+        write_workflow(storage_dir, workflow_id)
+        path = storage_dir / f"{workflow_id}.json"
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data.pop("trigger_type", None)
+        data.pop("trigger_summary", None)
+        path.write_text(json.dumps(data), encoding="utf-8")
+        return path
+
+    async def test_rewrites_legacy_files_atomically(self, tmp_path):
+        storage = WorkflowStorage(storage_dir=tmp_path)
+        path = self.write_legacy_workflow(tmp_path, "wf_000000000000")
+
+        assert await storage.backfill_trigger_summaries() == 1
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["trigger_type"] and data["trigger_summary"]
+        assert not list(tmp_path.glob("*.tmp"))
+        assert await storage.backfill_trigger_summaries() == 0
+
+    async def test_failed_write_leaves_file_intact(self, tmp_path):
+        storage = WorkflowStorage(storage_dir=tmp_path)
+        path = self.write_legacy_workflow(tmp_path, "wf_000000000000")
+        original = path.read_bytes()
+
+        with patch.object(Path, "replace", side_effect=OSError("disk full")):
+            assert await storage.backfill_trigger_summaries() == 0
+
+        assert path.read_bytes() == original
+        assert not list(tmp_path.glob("*.tmp"))
+
+
+class TestActivateFromCanvas:
+    """POST /api/v1/workflows/activate persistence"""
+
+    CANVAS = {
+        "workflow_name": "Canvas workflow",
+        "nodes": [
+            {"id": "trigger_1", "type": "trigger", "position": {"x": 0, "y": 0},
+             "data": {"label": "Daily", "type": "time", "schedule": "daily at 9am"}},
+            {"id": "action_1", "type": "stake", "position": {"x": 0, "y": 150},
+             "data": {"label": "Stake NEO", "token": "NEO", "percentage": 50}},
+        ],
+        "edges": [{"id": "e1", "source": "trigger_1", "target": "action_1"}],
+    }
+
+    async def test_writes_through_storage(self, storage):
+        response = client.post("/api/v1/workflows/activate", json=self.CANVAS)
+
+        assert response.status_code == 200
+        workflow_id = response.json()["workflow_id"]
+        path = storage.storage_dir / f"{workflow_id}.json"
+        # Same indented format as save_workflow, and no temp file left behind
+        assert path.read_text(encoding="utf-8").startswith('{\n  "workflow_id"')
+        assert not list(storage.storage_dir.glob("*.tmp"))
+        assert (await storage.load_workflow(workflow_id)).status == "active"
+
+    def test_failed_write_leaves_no_files(self, storage):
+        with patch.object(Path, "replace", side_effect=OSError("disk full")):
+            response = client.post("/api/v1/workflows/activate", json=self.CANVAS)
+
+        assert response.status_code == 500
+        assert not list(storage.storage_dir.glob("*.json"))
+        assert not list(storage.storage_dir.glob("*.tmp"))
+
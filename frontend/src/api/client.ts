@@ -182,6 +182,7 @@ class ApiClient {
       confidence?: number;
       parse_time_ms?: number;
       sla_exceeded?: boolean;
+      workflow_spec_token?: string;
       error?: {
         code: string;
         message: string;
@@ -218,7 +219,12 @@ class ApiClient {
   /**
    * Generate workflow graph from workflow spec
    */
-  async generateWorkflow(workflowSpec: unknown, userId?: string, userAddress?: string) {
+  async generateWorkflow(
+    workflowSpec: unknown,
+    userId?: string,
+    userAddress?: string,
+    workflowSpecToken?: string
+  ) {
     return this.post<{
       success: boolean;
       workflow_id?: string;
@@ -252,6 +258,7 @@ class ApiClient {
       workflow_spec: workflowSpec,
       user_id: userId,
       user_address: userAddress,
+      workflow_spec_token: workflowSpecToken,
     });
   }
 
@@ -395,10 +402,12 @@ class ApiClient {
   /**
    * List all workflows
    */
-  async listWorkflows(params?: { status?: string; user_id?: string }) {
+  async listWorkflows(params?: { status?: string; user_id?: string; limit?: number; offset?: number }) {
     const queryParams = new URLSearchParams();
     if (params?.status) queryParams.set('workflow_status', params.status);
     if (params?.user_id) queryParams.set('user_id', params.user_id);
+    if (params?.limit !== undefined) queryParams.set('limit', String(params.limit));
+    if (params?.offset !== undefined) queryParams.set('offset', String(params.offset));
     const query = queryParams.toString();
 
     return this.get<{
@@ -416,10 +425,40 @@ class ApiClient {
         last_executed_at: string | null;
       }>;
       total: number;
+      limit: number;
+      offset: number;
+      has_more: boolean;
       timestamp: string;
     }>(`/api/v1/workflows${query ? `?${query}` : ''}`);
   }
 
+  /**
+   * List every matching workflow, following pages until has_more is false
+   */
+  async listAllWorkflows(params?: { status?: string; user_id?: string; pageSize?: number }) {
+    const { pageSize: limit = 200, ...filters } = params ?? {};
+    let offset = 0;
+    let result = await this.listWorkflows({ ...filters, limit, offset });
+    if (!result.success || !result.data || !Array.isArray(result.data.workflows)) {
+      return result;
+    }
+
+    const workflows = [...result.data.workflows];
+    while (result.data?.has_more) {
+      offset += limit;
+      result = await this.listWorkflows({ ...filters, limit, offset });
+      if (!result.success || !result.data || !Array.isArray(result.data.workflows)) {
+        return result;
+      }
+      workflows.push(...result.data.workflows);
+    }
+
+    return {
+      ...result,
+      data: { ...result.data!, workflows, offset: 0, has_more: false },
+    };
+  }
+
   /**
    * Get workflow details
    */
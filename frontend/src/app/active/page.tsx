@@ -77,7 +77,7 @@ export default function ActiveWorkflowsPage() {
     setIsLoading(true);
     setError(null);
     try {
-      const result = await apiClient.listWorkflows();
+      const result = await apiClient.listAllWorkflows();
       if (result.success && result.data) {
         // Check for backend success and workflows array
         if (result.data.success !== false && Array.isArray(result.data.workflows)) {
@@ -105,7 +105,7 @@ export default function HistoryPage() {
     setError(null);
     try {
       // Fetch workflows for reference
-      const workflowResult = await apiClient.listWorkflows();
+      const workflowResult = await apiClient.listAllWorkflows();
       if (workflowResult.success && workflowResult.data) {
         // Check for backend success and workflows array
         if (workflowResult.data.success !== false && Array.isArray(workflowResult.data.workflows)) {
@@ -94,7 +94,10 @@ export function NLInput() {
         // Step 2: Generate the visual workflow
         setIsGenerating(true);
         const generateResponse = await apiClient.generateWorkflow(
-          parseResponse.data.workflow_spec
+          parseResponse.data.workflow_spec,
+          undefined,
+          undefined,
+          parseResponse.data.workflow_spec_token
         );
 
         // Check for generation errors
@@ -59,6 +59,7 @@ export interface ParseSuccessResponse {
   confidence: number;
   parse_time_ms: number;
   sla_exceeded: boolean;
+  workflow_spec_token?: string;
 }
 
 export interface ParseErrorResponse {
@@ -123,6 +124,7 @@ export interface GenerateRequest {
   workflow_spec: WorkflowSpec;
   user_id?: string;
   user_address?: string;
+  workflow_spec_token?: string;
 }
 
 export interface GenerateSuccessResponse {